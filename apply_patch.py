@@ -13,15 +13,19 @@ file operation and commit the change:
     python apply_patch.py '<json-string>'  /path/to/repo
     echo "$json" | python apply_patch.py -  /path/to/repo
 
+A JSON **array** of patches is applied in order within one process (one
+commit each), which saves an interpreter start and import per patch;
+`apply_patches()` is the library form.
+
 Operations
 ----------
-| op      | Required keys                 | Notes                                      |
-|---------|-------------------------------|--------------------------------------------|
-| create  | file, body | body_b64         | Fails if *file* already exists             |
-| update  | file, body | body_b64         | Fails if *file* missing or locally dirty   |
-| delete  | file                             | Fails if missing or path is a directory    |
-| rename  | file, target                     | Target must not exist                      |
-| chmod   | file, mode (644 / 755)           | 3‑ or 4‑digit octal accepted (0755 ok)     |
+| op      | Required keys                          | Notes                                      |
+|---------|----------------------------------------|--------------------------------------------|
+| create  | file, body | body_b64 | body_path     | Fails if *file* already exists             |
+| update  | file, body | body_b64 | body_path     | Fails if *file* missing or locally dirty   |
+| delete  | file                                   | Fails if missing or path is a directory    |
+| rename  | file, target                           | Target must not exist                      |
+| chmod   | file, mode (644 / 755)                 | 3‑ or 4‑digit octal accepted (0755 ok)     |
 
 Safety & Guarantees
 -------------------
@@ -29,8 +33,15 @@ Safety & Guarantees
 * **No traversal**: rejects any path escaping repo root (../ or symlink tricks).
 * **.git guard**: refuses any operation inside `.git/`.
 * **Local changes**: refuses destructive ops if the file differs from HEAD.
+  One path‑limited `git status --porcelain=v2` answers both "tracked?" and
+  "modified?" per patch.
 * **Full‑file only**: create/update always write full file bodies (no diffs).
+  Large bodies can be staged on disk and passed as `body_path` (a file inside
+  `GPT_REVIEW_STAGING_DIR`); they are copied verbatim with sendfile(2)
+  instead of travelling through the JSON payload.
 * **Atomic writes**: data is written to a temp file then atomically replaced.
+  The temp file is fsynced first only when `GPT_REVIEW_FSYNC=1` (the commit is
+  the durability point; git does not fsync its objects by default either).
 * **Precise staging**: only the affected paths are staged/committed.
 * **Idempotent**: no‑op commits are skipped; repeated identical updates are ignored.
 * **Safe chmod**: only 0644 / 0755 (or 3‑digit forms) are allowed on regular files.
@@ -42,121 +53,293 @@ actions; DEBUG for details.
 """
 from __future__ import annotations
 
-import base64
-import json
+import errno
+import functools
+import mmap
 import os
 import re
-import shutil
+import stat
 import subprocess
 import sys
-import tempfile
-from pathlib import Path
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from gpt_review import get_logger
-from patch_validator import validate_patch  # schema validator (raises on error)
+from patch_validator import _json_loads, validate_patch  # schema validator (raises on error)
+
+# Optional in‑process status probe (pip install .[git]); staging and commits
+# always go through the git CLI so hooks and `commit --only` keep working.
+try:
+    import pygit2 as _pygit2
+except ImportError:  # pragma: no cover
+    _pygit2 = None
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants & logger
 # ─────────────────────────────────────────────────────────────────────────────
-SAFE_MODES = {"644", "755"}  # normalized 3‑digit whitelist
+SAFE_MODES = {0o644: "644", 0o755: "755"}  # permitted mode bits → 3‑digit form
+_DESTRUCTIVE_OPS = frozenset({"update", "delete", "rename", "chmod"})  # need a clean file
 _DRIVE_RE = re.compile(r"^[A-Za-z]:[\\/]")
+_CR_RE = re.compile(rb"\r\n?")  # CRLF or lone CR → LF
+_CMP_CHUNK = 1 << 20  # bytes compared per step in _file_equals
+_B64_CHUNK = 64 * 1024  # base64 chars decoded per step (multiple of 4)
+_WRITE_BUFFER = 1 << 20  # temp‑file write buffer in _atomic_write_chunks
+_GIT_STATUS_IGNORED = 1 << 14  # libgit2 GIT_STATUS_IGNORED
+# sendfile(2) into a regular file is Linux‑only; macOS/BSD os.sendfile
+# needs a socket destination (same gate as shutil._USE_CP_SENDFILE).
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+# Exclusive create of a fresh temp file; never follows a planted symlink.
+_TMP_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0)
+)
+_ATOMIC_FSYNC = os.getenv("GPT_REVIEW_FSYNC", "0").strip().lower() in {"1", "true", "yes", "on"}
 log = get_logger(__name__)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Git helpers
 # ─────────────────────────────────────────────────────────────────────────────
-def _git(repo: Path, *args: str, capture: bool = False, check: bool = True) -> str:
+@functools.lru_cache(maxsize=1)
+def _git_exe() -> str:
+    """Absolute path of the git binary (falls back to a PATH lookup)."""
+    names = ("git.exe", "git") if os.name == "nt" else ("git",)
+    for directory in os.get_exec_path():
+        for name in names:
+            cand = os.path.join(directory, name)
+            if os.path.isfile(cand) and os.access(cand, os.X_OK):
+                return cand
+    return "git"
+
+
+def _git_run(repo: str, *args: str, capture: bool = True) -> subprocess.CompletedProcess:
     """
-    Run a git command inside *repo*. Return stdout if *capture* else "".
+    Spawn `git -C <repo> <args>` without raising on a non‑zero exit.
+
+    Kept posix_spawn‑eligible so a large parent (driver + browser) is not
+    fork()ed: absolute executable, no *cwd* (hence `-C`), no preexec hooks
+    and `close_fds=False` – safe because Python opens every fd with
+    O_CLOEXEC (PEP 446), so nothing leaks into git anyway.
     """
-    proc = subprocess.run(
-        ["git", "-C", str(repo), *args],
+    return subprocess.run(
+        [_git_exe(), "-C", repo, *args],
         text=True,
         capture_output=capture,
-        check=check,
+        close_fds=False,
     )
-    return proc.stdout if capture else ""
 
 
-def _git_ok(repo: Path, *args: str) -> bool:
-    """Return True if the git command exits with code 0 (never raises)."""
-    return subprocess.run(
-        ["git", "-C", str(repo), *args],
-        text=True,
-        capture_output=True,   # avoid noisy stderr on failures
-        check=False,
-    ).returncode == 0
+def _git(repo: str, *args: str, capture: bool = False, check: bool = True) -> str:
+    """
+    Run a git command inside *repo*. Return stdout if *capture* else "".
+    """
+    proc = _git_run(repo, *args, capture=capture)
+    if check:
+        proc.check_returncode()
+    return proc.stdout if capture else ""
 
 
-def _has_local_changes(repo: Path, rel_path: str) -> bool:
+def _path_state_pygit2(repo: str, rel_path: str) -> Optional[tuple[bool, bool]]:
     """
-    True if *rel_path* is modified (staged or unstaged) w.r.t HEAD.
+    `_path_state` answered by libgit2 in‑process, or None when pygit2 is not
+    installed or cannot answer (e.g. *rel_path* is a directory or unknown).
     """
-    status = _git(repo, "status", "--porcelain", "--", rel_path, capture=True)
-    return bool(status.strip())
+    if _pygit2 is None:
+        return None
+    try:
+        r = _pygit2.Repository(repo)
+        flags = r.status_file(rel_path)
+        tracked = rel_path in r.index
+    except Exception:
+        return None
+    return tracked, bool(flags & ~_GIT_STATUS_IGNORED)
 
 
-def _is_tracked(repo: Path, rel_path: str) -> bool:
-    """True if *rel_path* is tracked by Git (present in index)."""
-    return _git_ok(repo, "ls-files", "--error-unmatch", "--", rel_path)
+def _path_state(repo: str, rel_path: str) -> tuple[bool, bool]:
+    """
+    Return (tracked, dirty) for *rel_path* from a single path‑limited
+    `git status --porcelain=v2 -z` call (or in‑process via pygit2 when it
+    is installed, saving the git process).
+
+    * tracked – the path has an index entry (clean tracked files print
+      nothing, so an existing, non‑ignored path without records is tracked).
+    * dirty   – staged/unstaged change or untracked (`?`) entry under the
+      path; ignored (`!`) entries do not count.
+    """
+    state = _path_state_pygit2(repo, rel_path)
+    if state is not None:
+        return state
+    out = _git(
+        repo,
+        "--no-optional-locks",  # read‑only probe: never rewrite .git/index
+        "status",
+        "--porcelain=v2",
+        "-z",
+        "--untracked-files=all",
+        "--ignored=matching",
+        "--no-renames",
+        "--",
+        rel_path,
+        capture=True,
+    )
+    tracked = dirty = ignored = False
+    for rec in out.split("\0"):
+        kind = rec[:1]
+        if kind in ("1", "u"):
+            # "1 XY sub mH mI mW hH hI path" / "u XY sub m1 m2 m3 mW h1 h2 h3 path"
+            path = rec.split(" ", 8 if kind == "1" else 10)[-1]
+            dirty = True
+            tracked = tracked or (path == rel_path and rec[2] != "D")
+        elif kind == "?":
+            dirty = True
+        elif kind == "!":  # "dir/" when a whole directory is ignored
+            name = rec[2:]
+            ignored = ignored or name == rel_path or (name.endswith("/") and rel_path.startswith(name))
+    if not tracked and not dirty and not ignored:
+        tracked = os.path.lexists(os.path.join(repo, rel_path))
+    return tracked, dirty
+
+
+def _is_ignored(repo: str, rel_path: str) -> bool:
+    """
+    True if .gitignore rules exclude *rel_path* (tracked paths never are).
+
+    `_stage_exact` uses `update-index --add`, which – unlike `git add` –
+    does not consult the ignore rules, so paths to be staged are checked
+    here first: in‑process via pygit2 when installed, else `check-ignore`.
+    """
+    if _pygit2 is not None:
+        try:
+            return bool(_pygit2.Repository(repo).path_is_ignored(rel_path))
+        except Exception:
+            pass
+    return _git_run(repo, "check-ignore", "-q", "--", rel_path).returncode == 0
 
 
-def _index_has_changes(repo: Path, paths: Iterable[str] | None = None) -> bool:
+def _differs_from_head(repo: str, paths: Iterable[str]) -> bool:
     """
-    True if there are **staged** changes for the given *paths* (or any if None).
-    Uses `git diff --cached --quiet` which exits 0 when no staged changes exist.
+    True if any of *paths* differs from HEAD in the index or working tree.
+    Uses `git diff --quiet HEAD` which exits 0 when there is no difference.
     """
-    cmd = ["git", "-C", str(repo), "diff", "--cached", "--quiet"]
-    path_list = [p for p in (paths or []) if p]
-    if path_list:
-        cmd.extend(["--", *path_list])
-    return subprocess.run(cmd, text=True).returncode != 0
+    path_list = [p for p in paths if p]
+    return _git_run(repo, "diff", "--quiet", "HEAD", "--", *path_list).returncode != 0
 
 
-def _stage_exact(repo: Path, *paths: str) -> None:
+def _stage_exact(repo: str, *paths: str) -> None:
     """
     Stage **only** the given file paths (no parent‑dir sweeping).
 
-    • For deletions staged via `git rm`, re‑adding a missing path is a no‑op.
+    Uses the `update-index --add` plumbing: it hashes exactly the listed
+    files into the index without the pathspec/ignore walk `git add` does.
+    Callers only pass regular files they have just written or moved into
+    place, after refusing ignored paths (`_is_ignored`: update-index does
+    not read .gitignore), so there is no per‑path probe here; a missing
+    path makes git fail.
     """
-    to_add: list[str] = []
-    for p in dict.fromkeys(paths):  # de‑dupe while preserving order
-        if p and (repo / p).exists():
-            to_add.append(p)
+    to_add = [p for p in dict.fromkeys(paths) if p]  # de‑dupe, keep order
     if to_add:
-        _git(repo, "add", "--", *to_add)
+        _git(repo, "update-index", "--add", "--", *to_add)
 
 
-def _commit(repo: Path, message: str, paths: Iterable[str]) -> None:
-    """
-    Stage *paths* precisely and commit with *message* restricted to those paths.
+def _commit(repo: str, message: str, paths: Iterable[str], *, stage: bool = False) -> None:
     """
-    path_list = [p for p in paths if p]
-    _stage_exact(repo, *path_list)
+    Commit *paths* with *message*, restricted to exactly those paths.
 
-    if not _index_has_changes(repo, path_list):
-        log.info("No changes detected for commit: %s (skipping)", message)
-        return
+    `git commit --only -- <paths>` records the working‑tree state of the
+    given paths by itself, so tracked files need no prior `git add` and no
+    `git diff --cached` probe: one git process per commit. Set *stage* for
+    paths Git does not know yet (creates, untracked renames), which
+    `--only` cannot pick up on its own.
 
-    _git(repo, "commit", "-m", message, "--", *path_list)
+    A failed commit is treated as a no‑op only when the paths really match
+    HEAD; anything else (e.g. a rejecting hook) is raised.
+    """
+    path_list = [p for p in dict.fromkeys(paths) if p]
+    if stage:
+        _stage_exact(repo, *path_list)
+
+    proc = _git_run(
+        repo,
+        # Commit must not spawn `git maintenance run --auto` after every patch
+        # (gc.auto=0 covers git < 2.29, which runs `gc --auto` instead).
+        "-c", "maintenance.auto=false",
+        "-c", "gc.auto=0",
+        "commit", "--only", "-m", message, "--", *path_list,
+    )
+    if proc.returncode != 0:
+        if not _differs_from_head(repo, path_list):
+            log.info("No changes detected for commit: %s (skipping)", message)
+            return
+        raise subprocess.CalledProcessError(
+            proc.returncode, proc.args, output=proc.stdout, stderr=proc.stderr
+        )
     log.info("Committed: %s", message)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Path & content helpers
 # ─────────────────────────────────────────────────────────────────────────────
-def _ensure_inside(repo: Path, target: Path) -> None:
-    """Reject any path outside *repo* via ValueError."""
-    try:
-        target.relative_to(repo)
-    except ValueError as exc:
-        raise ValueError("Patch path escapes repository root") from exc
+@functools.lru_cache(maxsize=8)
+def _repo_root(repo_path: str) -> str:
+    """
+    Realpath of *repo_path*, verified to contain `.git` (FileNotFoundError
+    otherwise). Cached: a batch of patches against one repo resolves and
+    stats it once. Failures are not cached.
+    """
+    repo = os.path.realpath(repo_path)
+    if not os.path.exists(os.path.join(repo, ".git")):
+        raise FileNotFoundError(f"Not a git repo: {repo}")
+    return repo
+
+
+def _repo_path(repo: str, rel: str) -> str:
+    """
+    Map repo‑relative *rel* to an absolute path inside *repo* (ValueError if
+    it escapes).
+
+    The `..` check is purely lexical (normpath + prefix test, no syscalls).
+    Only the parent directory is realpath'd, to refuse symlinked
+    directories leading out of the repo; the leaf itself is not followed,
+    so create/update/delete/rename act on the path Git sees.
+    """
+    root = repo
+    prefix = root.rstrip(os.sep) + os.sep
+    norm = os.path.normpath(os.path.join(root, rel))
+    if not norm.startswith(prefix):
+        raise ValueError("Patch path escapes repository root")
+    parent = os.path.dirname(norm)
+    if parent != root:
+        real = os.path.realpath(parent)
+        if real != root and not real.startswith(prefix):
+            raise ValueError("Patch path escapes repository root")
+    return norm
+
+
+def _strip_dot_slash(rel: str) -> str:
+    """
+    Drop literal leading './' segments only. `str.lstrip("./")` strips a
+    character set and would turn '.git/x' into 'git/x' and '.github' into
+    'github'.
+    """
+    while rel.startswith("./"):
+        rel = rel.removeprefix("./")
+    return rel
 
 
 def _is_under_dot_git(rel: str) -> bool:
     """True if a repo‑relative path refers to `.git` or a descendant."""
-    s = rel.strip().lstrip("./")
-    return bool(s) and (s == ".git" or s.startswith(".git/") or "/.git/" in s or s.endswith("/.git"))
+    return ".git" in _strip_dot_slash(rel.strip()).split("/")
+
+
+def _names_dot_git(patch_json: str | dict) -> bool:
+    """True if a (rejected) payload's `file` or `target` points into `.git`."""
+    data = patch_json
+    if not isinstance(data, dict):
+        try:
+            data = _json_loads(data)
+        except ValueError:
+            return False
+    if not isinstance(data, dict):
+        return False
+    return any(
+        isinstance(data.get(key), str) and _is_under_dot_git(data[key]) for key in ("file", "target")
+    )
 
 
 def _normalize_rel_input(rel: str, *, field_name: str) -> str:
@@ -173,227 +356,520 @@ def _normalize_rel_input(rel: str, *, field_name: str) -> str:
         raise ValueError(f"{field_name} must use POSIX forward slashes, got backslash: {raw!r}")
     if raw.startswith("/") or _DRIVE_RE.match(raw):
         raise ValueError(f"{field_name} must be repository‑relative (not absolute): {raw!r}")
-    norm = raw.lstrip("./")
+    norm = _strip_dot_slash(raw)
     if not norm:
         raise ValueError(f"{field_name} resolves to repository root, which is not a file path.")
     return norm
 
 
-def _normalize_text(text: str) -> str:
-    """Normalize text payloads to LF and ensure a trailing newline."""
-    t = (text or "").replace("\r\n", "\n").replace("\r", "\n")
-    return t if t.endswith("\n") else t + "\n"
+def _normalize_bytes(data: bytes) -> bytes:
+    """
+    Normalize UTF‑8 text bytes to LF and ensure a trailing newline.
+
+    Works on the encoded bytes in one C‑level pass (CR never occurs inside
+    a multi‑byte UTF‑8 sequence), skipped entirely when there is no CR.
+    """
+    if b"\r" in data:
+        data = _CR_RE.sub(b"\n", data)
+    return data if data.endswith(b"\n") else data + b"\n"
+
+
+def _file_equals(p: str, expected: bytes | mmap.mmap, size: int) -> bool:
+    """
+    Return True if file *p* (of *size* bytes) holds exactly *expected*.
+
+    Compares a read‑only mmap against *expected* chunk by chunk, bailing
+    out at the first differing chunk instead of reading the whole file.
+    """
+    if size != len(expected):
+        return False
+    if size == 0:
+        return True
+    want = memoryview(expected)
+    with open(p, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for off in range(0, size, _CMP_CHUNK):
+            if mm[off : off + _CMP_CHUNK] != want[off : off + _CMP_CHUNK]:
+                return False
+    return True
 
 
-def _same_contents_text(p: Path, new_text: str) -> bool:
+def _same_contents_text(p: str, new_text: str, size: int) -> bool:
     """
-    Return True if file *p* is textually identical to *new_text* **after
-    normalization** (EOLs and trailing newline). Avoids churny commits.
+    Return True if file *p* (currently *size* bytes) is textually identical
+    to *new_text* **after normalization** (EOLs and trailing newline).
+    Avoids churny commits.
+
+    Normalization can only shrink a file (CRLF → LF) or add one trailing
+    newline, so an obviously too small file is rejected from its size alone,
+    and an already normalized file is matched byte‑for‑byte. Both sides are
+    compared as normalized bytes; nothing is decoded.
     """
-    if not p.exists():
+    expected = _normalize_bytes(new_text.encode("utf-8"))
+    if size + 1 < len(expected):
         return False
     try:
-        current = p.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
+        if _file_equals(p, expected, size):
+            return True
+        with open(p, "rb") as fh:
+            current = fh.read()
+    except OSError:
         return False
-    return _normalize_text(current) == _normalize_text(new_text)
+    return _normalize_bytes(current) == expected
 
 
-def _same_contents_binary(p: Path, new_b64: str) -> bool:
-    """Return True if file *p* already equals the decoded base64 bytes."""
-    if not p.exists():
-        return False
+def _b64_decoded_len(body_b64: str) -> int:
+    """Size in bytes of the decoded *body_b64* payload, without decoding it."""
+    if len(body_b64) % 4:
+        raise ValueError("Invalid base64 payload in 'body_b64'.")
+    return len(body_b64) // 4 * 3 - body_b64[-2:].count("=")
+
+
+def _iter_b64(body_b64: str) -> Iterator[bytes]:
+    """
+    Strictly decode *body_b64* in `_B64_CHUNK` slices (ValueError on bad
+    input) so a large binary payload is never materialised in one piece.
+    """
+    import base64  # only binary payloads need it
+
+    for off in range(0, len(body_b64), _B64_CHUNK):
+        try:
+            yield base64.b64decode(body_b64[off : off + _B64_CHUNK], validate=True)
+        except Exception as exc:
+            raise ValueError("Invalid base64 payload in 'body_b64'.") from exc
+
+
+def _same_contents_binary(p: str, body_b64: str, size: int) -> bool:
+    """
+    Return True if file *p* (currently *size* bytes) already equals the
+    decoded *body_b64*.
+
+    The size check needs no decoding; only a same‑sized file is compared,
+    one decoded chunk at a time against a read‑only mmap.
+    """
     try:
-        decoded = base64.b64decode(new_b64, validate=True)
+        if size != _b64_decoded_len(body_b64):
+            return False
+        if size == 0:
+            return True
+        off = 0
+        with open(p, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for chunk in _iter_b64(body_b64):
+                if mm[off : off + len(chunk)] != chunk:
+                    return False
+                off += len(chunk)
+        return off == size
     except Exception:
         return False
+
+
+def _atomic_write(dest: str, fill: Callable[[int], int], *, mode: Optional[int] = None) -> int:
+    """
+    Atomically replace *dest* with whatever *fill(fd)* writes into a
+    same‑dir temp file (fill returns the byte count). Ensures parent
+    directories exist; fsyncs before replace only if `_ATOMIC_FSYNC`.
+    Returns bytes written.
+
+    The temp file gets a random name and is created exclusively (O_EXCL,
+    plus O_NOFOLLOW where available), so nothing planted in the work tree
+    can be followed or truncated. It is created 0666 so the kernel applies
+    the umask – as a plain `open()` would; pass the existing file's *mode*
+    to keep it instead (e.g. 755 scripts; skipped where os.fchmod is
+    missing, i.e. Windows before 3.13, which has no exec bit to keep). On
+    any failure, including the final replace, the temp file is removed.
+    """
+    parent, name = os.path.split(dest)
+    os.makedirs(parent, exist_ok=True)
+    for _ in range(100):
+        tmp_path = os.path.join(parent, f".{name}.{os.urandom(6).hex()}.gpt-tmp")
+        try:
+            fd = os.open(tmp_path, _TMP_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+    else:  # pragma: no cover - 100 collisions of 48 random bits
+        raise FileExistsError(errno.EEXIST, "No usable temporary file name", parent)
     try:
-        return p.read_bytes() == decoded
-    except Exception:
+        try:
+            if mode is not None and hasattr(os, "fchmod"):
+                os.fchmod(fd, mode)
+            written = fill(fd)
+            if _ATOMIC_FSYNC:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        _unlink_quiet(tmp_path)
+        raise
+    return written
+
+
+def _atomic_write_chunks(dest: str, chunks: Iterable[bytes], *, mode: Optional[int] = None) -> int:
+    """Write *chunks* atomically into *dest* (see `_atomic_write`)."""
+
+    def fill(fd: int) -> int:
+        written = 0
+        # Small decoded slices are coalesced into _WRITE_BUFFER‑sized
+        # write(2) calls; payloads larger than the buffer go straight through.
+        with open(fd, "wb", buffering=_WRITE_BUFFER, closefd=False) as out:
+            for chunk in chunks:
+                written += out.write(chunk)
+        return written
+
+    return _atomic_write(dest, fill, mode=mode)
+
+
+def _atomic_copy_file(dest: str, source: str, *, mode: Optional[int] = None) -> int:
+    """
+    Copy *source* atomically into *dest* (see `_atomic_write`) with
+    sendfile(2) on Linux, so memory use does not grow with size. Elsewhere,
+    or if the kernel refuses sendfile before any byte was copied, a reused
+    buffer is filled with `readinto` and written with os.write.
+    """
+
+    def fill(fd: int) -> int:
+        written = 0
+        with open(source, "rb", buffering=0) as src:
+            if _USE_SENDFILE:
+                try:
+                    while sent := os.sendfile(fd, src.fileno(), written, _WRITE_BUFFER):
+                        written += sent
+                    return written
+                except OSError:
+                    if written:
+                        raise
+            buf = bytearray(_WRITE_BUFFER)
+            view = memoryview(buf)
+            while n := src.readinto(buf):
+                chunk = view[:n]
+                while chunk:
+                    chunk = chunk[os.write(fd, chunk) :]
+                written += n
+        return written
+
+    return _atomic_write(dest, fill, mode=mode)
+
+
+def _staged_body(body_path: str) -> str:
+    """
+    Resolve a `body_path` patch field: it must name a regular file inside the
+    staging directory (`GPT_REVIEW_STAGING_DIR`, default
+    `<tmp>/gpt-review-staging`). ValueError otherwise.
+    """
+    staging = os.getenv("GPT_REVIEW_STAGING_DIR")
+    if not staging:
+        import tempfile  # only needed for the default location
+
+        staging = os.path.join(tempfile.gettempdir(), "gpt-review-staging")
+    root = os.path.realpath(staging)
+    real = os.path.realpath(body_path)
+    if os.path.commonpath([real, root]) != root or not os.path.isfile(real):
+        raise ValueError(f"'body_path' must be a file inside the staging dir {root}: {body_path!r}")
+    return real
+
+
+def _same_contents_staged(p: str, staged: str, size: int) -> bool:
+    """Return True if file *p* (currently *size* bytes) equals *staged*."""
+    try:
+        if os.stat(staged).st_size != size:
+            return False
+        if size == 0:
+            return True
+        with open(staged, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _file_equals(p, mm, size)
+    except (OSError, ValueError):
         return False
 
 
-def _atomic_write_bytes(dest: Path, data: bytes) -> None:
+def _atomic_write_bytes(dest: str, data: bytes, *, mode: Optional[int] = None) -> None:
     """
-    Write *data* atomically into *dest* (same‑dir temp + replace). Ensures
-    parent directories exist and fsyncs before replace.
+    Write *data* atomically into *dest* (see `_atomic_write`) straight from
+    the caller's buffer: no Python‑level write buffer, usually one write(2).
     """
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(dir=str(dest.parent), delete=False) as tmp:
-        tmp.write(data)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        tmp_path = Path(tmp.name)
-    os.replace(tmp_path, dest)
 
+    def fill(fd: int) -> int:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        return len(data)
+
+    _atomic_write(dest, fill, mode=mode)
 
-def _write_file(dest: Path, *, body: Optional[str], body_b64: Optional[str]) -> tuple[int, int]:
+
+def _write_file(
+    dest: str,
+    *,
+    body: Optional[str],
+    body_b64: Optional[str],
+    st: Optional[os.stat_result],
+    body_path: Optional[str] = None,
+) -> tuple[int, int]:
     """
-    Write *body* (text) or *body_b64* (binary) into *dest* atomically.
+    Write *body* (text), *body_b64* (binary, decoded in chunks) or the
+    staged file *body_path* (bytes verbatim) into *dest* atomically. *st*
+    is the caller's stat of *dest* (None if it does not exist yet), so no
+    further stat calls are needed.
 
     Returns (written_bytes, previous_size).
     """
-    prev_size = dest.stat().st_size if dest.exists() else 0
+    prev_size = st.st_size if st is not None else 0
+    mode = st.st_mode & 0o7777 if st is not None else None
+
+    if body_path is not None:
+        written = _atomic_copy_file(dest, body_path, mode=mode)
+        log.debug("Copied staged body %s → %s (%d bytes)", body_path, dest, written)
+        return written, prev_size
 
     if body_b64 is not None:
-        try:
-            data = base64.b64decode(body_b64, validate=True)
-        except Exception as exc:
-            raise ValueError("Invalid base64 payload in 'body_b64'.") from exc
-        _atomic_write_bytes(dest, data)
-        log.debug("Wrote binary file %s (%d bytes)", dest, len(data))
-        return len(data), prev_size
+        written = _atomic_write_chunks(dest, _iter_b64(body_b64), mode=mode)
+        log.debug("Wrote binary file %s (%d bytes)", dest, written)
+        return written, prev_size
 
     # text path
-    text = _normalize_text(body or "")
-    data = text.encode("utf-8")
-    _atomic_write_bytes(dest, data)
-    log.debug("Wrote text file %s (%d bytes utf‑8)", dest, len(data))
-    return len(data), prev_size
+    encoded = _normalize_bytes((body or "").encode("utf-8"))
+    _atomic_write_bytes(dest, encoded, mode=mode)
+    log.debug("Wrote text file %s (%d bytes utf‑8)", dest, len(encoded))
+    return len(encoded), prev_size
+
+
+def _unlink_quiet(path: str) -> None:
+    """Remove *path* if it exists (cleanup after a failed write/copy)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fast_move(src: str, target: str) -> None:
+    """
+    Move a regular file: one rename(2) on the same filesystem; across
+    devices (EXDEV) a kernel‑side copy (`shutil.copyfile` uses sendfile on
+    Linux), the permission bits, then unlink of *src*.
+    """
+    try:
+        os.replace(src, target)
+        return
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+    import shutil  # rare cross‑device fallback only
+
+    try:
+        shutil.copyfile(src, target)
+        shutil.copymode(src, target)
+    except BaseException:
+        _unlink_quiet(target)
+        raise
+    os.unlink(src)
 
 
-def _normalize_mode(mode: str) -> str:
+def _normalize_mode(mode: str) -> int:
     """
-    Accept both 3‑digit and 4‑digit octal strings and normalize to 3‑digit.
+    Accept both 3‑digit and 4‑digit octal strings and return the mode bits.
 
     Examples
     --------
-    "0755" → "755", "644" → "644"
+    "0755" → 0o755, "644" → 0o644
 
     Raises
     ------
-    PermissionError if the normalized mode is not in SAFE_MODES.
+    PermissionError if the mode is not one of SAFE_MODES.
     """
     s = (mode or "").strip()
-    if not re.fullmatch(r"[0-7]{3,4}", s):
+    if not (3 <= len(s) <= 4 and s.isascii() and s.isdigit() and "8" not in s and "9" not in s):
         raise PermissionError(f"Invalid chmod mode {mode!r} (must be octal)")
-    normalized = s.lstrip("0") or "0"
-    if normalized not in SAFE_MODES:
+    value = int(s, 8)
+    if value not in SAFE_MODES:
         raise PermissionError("Unsafe chmod (allowed: 0644/644 or 0755/755)")
-    return normalized
+    return value
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Op handlers
+# ─────────────────────────────────────────────────────────────────────────────
+def _do_write(repo: str, op: str, rel: str, src: str, patch: dict, tracked: bool) -> None:
+    """create / update: write the new body atomically and commit it."""
+    body: Optional[str] = patch.get("body")
+    body_b64: Optional[str] = patch.get("body_b64")
+    body_path: Optional[str] = (
+        _staged_body(patch["body_path"]) if patch.get("body_path") is not None else None
+    )
+
+    if body is None and body_b64 is None and body_path is None:
+        raise ValueError(
+            "create/update requires 'body' (text), 'body_b64' (binary) or 'body_path' (staged file)"
+        )
+
+    # One stat serves the existence check, the no‑op size checks and
+    # the mode/size bookkeeping in _write_file.
+    try:
+        st: Optional[os.stat_result] = os.stat(src)
+    except FileNotFoundError:
+        st = None
+
+    if op == "create":
+        if st is not None:
+            raise FileExistsError(src)
+        if _is_ignored(repo, rel):
+            raise PermissionError(f"Refusing to create '{rel}' – path is ignored by .gitignore")
+    else:  # update
+        if st is None:
+            raise FileNotFoundError(src)
+        # No‑op fast‑path
+        if body is not None and _same_contents_text(src, body, st.st_size):
+            log.info("No content change for %s – skipping update.", rel)
+            return
+        if body_b64 is not None and _same_contents_binary(src, body_b64, st.st_size):
+            log.info("No binary change for %s – skipping update.", rel)
+            return
+        if body_path is not None and _same_contents_staged(src, body_path, st.st_size):
+            log.info("No staged change for %s – skipping update.", rel)
+            return
+
+    _write_file(src, body=body, body_b64=body_b64, st=st, body_path=body_path)
+    _commit(repo, f"GPT {op}: {rel}", paths=[rel], stage=op == "create")
+
+
+def _do_delete(repo: str, op: str, rel: str, src: str, patch: dict, tracked: bool) -> None:
+    """delete: `git rm` + commit for tracked files, plain unlink otherwise."""
+    if not os.path.exists(src):
+        raise FileNotFoundError(src)
+    if os.path.isdir(src):
+        raise IsADirectoryError(src)
+
+    if tracked:
+        _git(repo, "rm", "-f", "--", rel)  # stages deletion
+        _commit(repo, f"GPT delete: {rel}", paths=[rel])
+    else:
+        os.unlink(src)
+        log.info("Deleted untracked file %s (no commit).", rel)
+
+
+def _do_rename(repo: str, op: str, rel: str, src: str, patch: dict, tracked: bool) -> None:
+    """rename: `git mv` for tracked files, a filesystem move + add otherwise."""
+    target_rel_raw: str = patch.get("target") or ""
+    target_rel: str = _normalize_rel_input(target_rel_raw, field_name="target")
+    if _is_under_dot_git(target_rel):
+        raise PermissionError("Refusing to move a path into .git/")
+
+    target = _repo_path(repo, target_rel)
+
+    if not os.path.exists(src):
+        raise FileNotFoundError(src)
+    if os.path.lexists(target):
+        raise FileExistsError(target)
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    if tracked:
+        # Accurate rename staging
+        _git(repo, "mv", "--", rel, target_rel)
+        log.debug("git mv: %s -> %s", rel, target_rel)
+        _commit(repo, f"GPT rename: {rel} -> {target_rel}", paths=[rel, target_rel])
+    else:
+        if os.path.isdir(src):
+            raise IsADirectoryError(f"Refusing to rename untracked directory: {rel}")
+        if _is_ignored(repo, target_rel):
+            raise PermissionError(f"Refusing to rename onto '{target_rel}' – path is ignored by .gitignore")
+        _fast_move(src, target)
+        log.debug("fs move: %s -> %s", rel, target_rel)
+        _commit(
+            repo,
+            f"GPT add (rename of untracked): {target_rel}",
+            paths=[target_rel],
+            stage=True,
+        )
+
+
+def _do_chmod(repo: str, op: str, rel: str, src: str, patch: dict, tracked: bool) -> None:
+    """chmod: set a SAFE_MODES mode; commit only if Git's exec bit changes."""
+    mode_raw: str = patch.get("mode") or ""
+    desired = _normalize_mode(mode_raw)
+    mode = SAFE_MODES[desired]
+    if not os.path.exists(src):
+        raise FileNotFoundError(src)
+    if os.path.islink(src):  # os.chmod would follow the link
+        raise PermissionError(f"Refusing to chmod a symlink: {rel}")
+    st = os.stat(src)
+    if not stat.S_ISREG(st.st_mode):
+        raise IsADirectoryError(f"chmod only allowed on regular files: {rel}")
+
+    current = st.st_mode & 0o777
+    if current == desired:
+        log.info("Mode for %s already %s – skipping chmod.", rel, mode)
+        return
+
+    os.chmod(src, desired)
+    if bool(desired & 0o111) == bool(current & 0o111):
+        # Git only records the executable bit (100644 vs 100755).
+        log.info("Git mode for %s unchanged by %s – no commit needed.", rel, mode)
+        return
+    _commit(repo, f"GPT chmod {mode}: {rel}", paths=[rel])
+
+
+# op → handler, built once at import.
+_OPS: dict[str, Callable[[str, str, str, str, dict, bool], None]] = {
+    "create": _do_write,
+    "update": _do_write,
+    "delete": _do_delete,
+    "rename": _do_rename,
+    "chmod": _do_chmod,
+}
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Core apply logic
 # ─────────────────────────────────────────────────────────────────────────────
-def apply_patch(patch_json: str, repo_path: str) -> None:
+def apply_patch(patch_json: str | dict, repo_path: str) -> None:
     """
     Validate patch payload, perform the operation, and commit precisely.
     """
-    # Validate schema first (raises on error)
-    validate_patch(patch_json)
-
-    # Parse JSON into dict (supports being called with either JSON string or dict stringified)
-    patch = json.loads(patch_json)
-    repo = Path(repo_path).resolve()
-
-    if not (repo / ".git").exists():
-        raise FileNotFoundError(f"Not a git repo: {repo}")
+    # Validate schema first (raises on error). The validator's compiled
+    # Draft7Validator is built once at import and it returns the parsed dict,
+    # so the payload is not decoded a second time here.
+    try:
+        patch = validate_patch(patch_json)
+    except ValueError as exc:
+        # The validator rejects `.git` paths as merely unsafe; surface them
+        # as the permission error callers (and the CLI) expect.
+        if _names_dot_git(patch_json):
+            raise PermissionError("Refusing to operate inside .git/") from exc
+        raise
+    repo = _repo_root(repo_path)
 
     # Validate and normalize primary path
     rel: str = _normalize_rel_input(patch.get("file") or "", field_name="file")
     if _is_under_dot_git(rel):
         raise PermissionError("Refusing to operate inside .git/")
 
-    src = (repo / rel).resolve()
-    _ensure_inside(repo, src)
+    src = _repo_path(repo, rel)
 
     op = (patch.get("op") or "").strip().lower()
+    handler = _OPS.get(op)
+    if handler is None:
+        raise ValueError(f"Unknown op '{op}' encountered.")
     log.info("Applying op=%s path=%s", op, rel)
 
+    # One status query answers both "tracked?" and "locally modified?"
+    tracked, dirty = _path_state(repo, rel) if op in _DESTRUCTIVE_OPS else (False, False)
+
     # Guard against accidental overwrite of locally modified files
-    if op in {"update", "delete", "rename", "chmod"} and _has_local_changes(repo, rel):
+    if dirty:
         raise RuntimeError(f"Refusing to {op} '{rel}' – local modifications detected.")
 
-    # ----------------------- create / update -------------------------------
-    if op in {"create", "update"}:
-        body: Optional[str] = patch.get("body")
-        body_b64: Optional[str] = patch.get("body_b64")
-
-        if body is None and body_b64 is None:
-            raise ValueError("create/update requires 'body' (text) or 'body_b64' (binary)")
-
-        if op == "create":
-            if src.exists():
-                raise FileExistsError(src)
-        else:  # update
-            if not src.exists():
-                raise FileNotFoundError(src)
-            # No‑op fast‑path
-            if body is not None and _same_contents_text(src, body):
-                log.info("No content change for %s – skipping update.", rel)
-                return
-            if body_b64 is not None and _same_contents_binary(src, body_b64):
-                log.info("No binary change for %s – skipping update.", rel)
-                return
-
-        _write_file(src, body=body, body_b64=body_b64)
-        _commit(repo, f"GPT {op}: {rel}", paths=[rel])
-        return
-
-    # ---------------------------- delete -----------------------------------
-    if op == "delete":
-        if not src.exists():
-            raise FileNotFoundError(src)
-        if src.is_dir():
-            raise IsADirectoryError(src)
-
-        if _is_tracked(repo, rel):
-            _git(repo, "rm", "-f", "--", rel)  # stages deletion
-            _commit(repo, f"GPT delete: {rel}", paths=[rel])
-        else:
-            src.unlink()
-            log.info("Deleted untracked file %s (no commit).", rel)
-        return
+    handler(repo, op, rel, src, patch, tracked)
 
-    # ---------------------------- rename -----------------------------------
-    if op == "rename":
-        target_rel_raw: str = patch.get("target") or ""
-        target_rel: str = _normalize_rel_input(target_rel_raw, field_name="target")
-        if _is_under_dot_git(target_rel):
-            raise PermissionError("Refusing to move a path into .git/")
-
-        target = (repo / target_rel).resolve()
-        _ensure_inside(repo, target)
-
-        if not src.exists():
-            raise FileNotFoundError(src)
-        if target.exists():
-            raise FileExistsError(target)
-
-        target.parent.mkdir(parents=True, exist_ok=True)
-
-        if _is_tracked(repo, rel):
-            # Accurate rename staging
-            _git(repo, "mv", "--", rel, target_rel)
-            log.debug("git mv: %s -> %s", rel, target_rel)
-            _commit(repo, f"GPT rename: {rel} -> {target_rel}", paths=[rel, target_rel])
-        else:
-            shutil.move(src, target)
-            log.debug("fs move: %s -> %s", rel, target_rel)
-            _commit(repo, f"GPT add (rename of untracked): {target_rel}", paths=[target_rel])
-        return
 
-    # ---------------------------- chmod ------------------------------------
-    if op == "chmod":
-        mode_raw: str = patch.get("mode") or ""
-        mode = _normalize_mode(mode_raw)
-        if not src.exists():
-            raise FileNotFoundError(src)
-        if not src.is_file():
-            raise IsADirectoryError(f"chmod only allowed on regular files: {rel}")
-
-        desired = int(mode, 8)
-        current = src.stat().st_mode & 0o777
-        if current == desired:
-            log.info("Mode for %s already %s – skipping chmod.", rel, mode)
-            return
-
-        os.chmod(src, desired)
-        _commit(repo, f"GPT chmod {mode}: {rel}", paths=[rel])
-        return
+def apply_patches(patches: Iterable[str | dict], repo_path: str) -> int:
+    """
+    Apply *patches* to *repo_path* sequentially, one commit per patch.
 
-    # -----------------------------------------------------------------------
-    raise ValueError(f"Unknown op '{op}' encountered.")
+    Stops at the first failure (the exception propagates; earlier patches
+    stay committed). Returns the number of patches applied.
+    """
+    applied = 0
+    for patch in patches:
+        apply_patch(patch, repo_path)
+        applied += 1
+    return applied
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CLI
@@ -407,6 +883,10 @@ def _cli() -> None:
 
     patch_arg, repo_arg = sys.argv[1:]
     payload = sys.stdin.read() if patch_arg == "-" else patch_arg
+    if payload.lstrip().startswith("["):
+        batch = _json_loads(payload)  # orjson when installed, like validate_patch
+        log.info("Applied %d patch(es).", apply_patches(batch, repo_arg))
+        return
     apply_patch(payload, repo_arg)
 
 
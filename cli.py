@@ -38,29 +38,23 @@ Examples
 """
 from __future__ import annotations
 
-import argparse
-import json
+import logging
 import os
-import re
-import subprocess
 import sys
-import tempfile
-from importlib import resources
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from gpt_review import get_logger, get_version
+from gpt_review import get_version
 
-# Orchestrator (compatibility path that mirrors the new orchestrator)
-from gpt_review.workflow import OrchestratorConfig, ReviewWorkflow
+# The orchestrator, API driver and patch validator (and argparse itself) are
+# imported inside the handlers that use them, so `--version`, `version` and
+# `schema` never pay for the heavy dependency trees.
+if TYPE_CHECKING:  # pragma: no cover
+    import argparse
 
-# API driver (strict tool calls, optional run command)
-from gpt_review.api_driver import run as api_run
-
-# Patch validator (JSON‑Schema + extra guards)
-from patch_validator import validate_patch
-
-log = get_logger(__name__)
+# Same logger object `get_logger(__name__)` returns; main() configures the
+# package logging (log dir, handlers) only once past the fast paths.
+log = logging.getLogger(__name__)
 
 # Environment‑backed defaults (kept in sync with modules)
 DEFAULT_MODEL = os.getenv("GPT_REVIEW_MODEL", "gpt-5-codex")
@@ -74,17 +68,18 @@ DEFAULT_REMOTE = os.getenv("GPT_REVIEW_REMOTE", "origin")
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-_GIT_URL_RE = re.compile(r"^(?:https?://|git@|ssh://).*|.*\.git$")
+_GIT_URL_PREFIXES = ("http://", "https://", "git@", "ssh://")
 
 
 def _looks_like_git_url(arg: str) -> bool:
-    try:
-        return bool(_GIT_URL_RE.match(arg.strip()))
-    except Exception:
-        return False
+    s = arg.strip()
+    return s.startswith(_GIT_URL_PREFIXES) or s.endswith(".git")
 
 
 def _clone_repo_to_temp(url: str) -> Path:
+    import subprocess
+    import tempfile
+
     tmpdir = Path(tempfile.mkdtemp(prefix="gpt-review-cli-"))
     log.info("Cloning repo %s → %s", url, tmpdir)
     subprocess.run(["git", "clone", "--depth", "1", url, str(tmpdir)], check=True)
@@ -124,6 +119,8 @@ def cmd_iterate(args: argparse.Namespace) -> int:
     """
     Run the multi‑iteration orchestrator on the repository.
     """
+    from gpt_review.workflow import OrchestratorConfig, ReviewWorkflow
+
     repo = _resolve_repo(args.repo)
     instructions = _read_instructions(args.instructions)
 
@@ -148,6 +145,8 @@ def cmd_api(args: argparse.Namespace) -> int:
     Run the tool‑driven API loop (no browser) until status='completed'
     and (if provided) the command passes.
     """
+    from gpt_review.api_driver import run as api_run
+
     repo = _resolve_repo(args.repo)
     instructions = _read_instructions(args.instructions)
     api_run(
@@ -167,6 +166,8 @@ def cmd_validate(args: argparse.Namespace) -> int:
     """
     Validate a single patch JSON payload.
     """
+    from patch_validator import validate_patch
+
     payload: Optional[str] = None
     if args.file:
         try:
@@ -193,14 +194,22 @@ def cmd_validate(args: argparse.Namespace) -> int:
         return 1
 
 
-def cmd_schema(_args: argparse.Namespace) -> int:
+def cmd_schema(_args: Optional[argparse.Namespace]) -> int:
     """
     Print the active JSON schema bundled with the package.
     """
+    from importlib import resources
+
     try:
-        with resources.files("gpt_review").joinpath("schema.json").open(encoding="utf-8") as fh:
-            data = json.load(fh)
-        print(json.dumps(data, indent=2, ensure_ascii=False))
+        raw = resources.files("gpt_review").joinpath("schema.json").read_bytes()
+        try:
+            import orjson  # optional (pip install .[fast]); identical output
+        except ImportError:
+            import json
+
+            print(json.dumps(json.loads(raw), indent=2, ensure_ascii=False))
+        else:
+            print(orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2).decode("utf-8"))
         return 0
     except Exception as exc:
         log.error("Failed to load bundled schema: %s", exc)
@@ -219,7 +228,7 @@ def cmd_scan(args: argparse.Namespace) -> int:
     return 0
 
 
-def cmd_version(_args: argparse.Namespace) -> int:
+def cmd_version(_args: Optional[argparse.Namespace]) -> int:
     print(get_version())
     return 0
 
@@ -228,7 +237,15 @@ def cmd_version(_args: argparse.Namespace) -> int:
 # Argument parser
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _add_model_flags(sp: argparse.ArgumentParser) -> None:
+    """Flags shared by the model‑driven subcommands (iterate, api)."""
+    sp.add_argument("--model", default=DEFAULT_MODEL, help=f"Model id (default: {DEFAULT_MODEL})")
+    sp.add_argument("--api-timeout", type=int, default=DEFAULT_API_TIMEOUT, help="HTTP timeout (seconds).")
+
+
 def _parser() -> argparse.ArgumentParser:
+    import argparse
+
     p = argparse.ArgumentParser(
         prog="gpt-review",
         description="GPT‑Review – multi‑iteration code review CLI",
@@ -247,8 +264,7 @@ def _parser() -> argparse.ArgumentParser:
     pi = sub.add_parser("iterate", help="Run the multi‑iteration orchestrator (plan‑first + 3 iterations)")
     pi.add_argument("instructions", help="Path to a plain‑text instructions file.")
     pi.add_argument("repo", help="Path to a git repository OR a Git URL to clone.")
-    pi.add_argument("--model", default=DEFAULT_MODEL, help=f"Model id (default: {DEFAULT_MODEL})")
-    pi.add_argument("--api-timeout", type=int, default=DEFAULT_API_TIMEOUT, help="HTTP timeout (seconds).")
+    _add_model_flags(pi)
     pi.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, choices=(1, 2, 3), help="Number of iterations (1..3).")
     pi.add_argument("--branch-prefix", default=DEFAULT_BRANCH_PREFIX, help=f"Branch prefix (default: {DEFAULT_BRANCH_PREFIX})")
     pi.add_argument("--remote", default=DEFAULT_REMOTE, help=f"Git remote to push (default: {DEFAULT_REMOTE})")
@@ -262,8 +278,7 @@ def _parser() -> argparse.ArgumentParser:
     pa.add_argument("repo", help="Path to a git repository OR a Git URL to clone.")
     pa.add_argument("--cmd", help="Command to run after each successful patch (e.g., 'pytest -q').")
     pa.add_argument("--timeout", type=int, default=300, help="Timeout for --cmd (seconds).")
-    pa.add_argument("--model", default=DEFAULT_MODEL, help=f"Model id (default: {DEFAULT_MODEL})")
-    pa.add_argument("--api-timeout", type=int, default=DEFAULT_API_TIMEOUT, help="HTTP timeout (seconds).")
+    _add_model_flags(pa)
     pa.set_defaults(func=cmd_api)
 
     # validate
@@ -290,7 +305,22 @@ def _parser() -> argparse.ArgumentParser:
     return p
 
 
+# Argument‑free commands answered without building the parser.
+_FAST_COMMANDS = {
+    ("--version",): cmd_version,
+    ("version",): cmd_version,
+    ("schema",): cmd_schema,
+}
+
+
 def main(argv: Optional[list[str]] = None) -> int:
+    fast = _FAST_COMMANDS.get(tuple(sys.argv[1:] if argv is None else argv))
+    if fast is not None:
+        return fast(None)
+
+    from gpt_review import get_logger
+
+    get_logger(__name__)
     try:
         parser = _parser()
         args = parser.parse_args(argv)
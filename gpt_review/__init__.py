@@ -7,14 +7,16 @@ GPT‑Review – Package Initialisation
 
 Exports
 -------
-* __version__     – Resolved from installed package metadata
+* __version__     – Build‑time constant from gpt_review/_version.py
 * get_version()   – Helper returning the version string
-* get_logger()    – Re‑export of the packaged logger.get_logger
+* get_logger()    – Re‑export of the packaged logger.get_logger (bound lazily)
 
 Side‑effects
 ------------
-* Configures the root "gpt_review" logger on first import so all sub‑modules
-  share the same rotating file + console handlers (see gpt_review/logger.py).
+* None at import time. The root "gpt_review" logger (rotating file + console
+  handlers, see gpt_review/logger.py) is configured by the first
+  `get_logger()` call, so `--version` and library‑style imports never open
+  a log file.
 
 Notes
 -----
@@ -24,38 +26,44 @@ a minimal console logger so that importing `gpt_review` never crashes.
 """
 from __future__ import annotations
 
+import functools
 import logging
-from importlib.metadata import PackageNotFoundError, version as _pkg_version
-from typing import Optional
+from typing import Any, Callable, Optional
+
+# Constant written alongside the package (pyproject reads it at build time),
+# so no importlib.metadata scan is needed on import.
+from gpt_review._version import __version__
 
 # -----------------------------------------------------------------------------
 # Logger bootstrap (prefer packaged implementation; else safe fallback)
 # -----------------------------------------------------------------------------
-try:
-    # Primary: packaged implementation (expected in normal installs)
-    from gpt_review.logger import get_logger as _delegate_get_logger  # type: ignore
-except Exception:  # pragma: no cover
-    _delegate_get_logger = None  # type: ignore[assignment]
+@functools.lru_cache(maxsize=1)
+def _fallback_handler() -> logging.Handler:
+    """Console handler + formatter for the fallback logger, built once."""
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.INFO)
+    ch.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s | %(name)s | %(process)d | %(levelname)-8s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    return ch
+
 
+@functools.lru_cache(maxsize=None)
 def _fallback_get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Minimal, idempotent console logger used only if the packaged
-    implementation cannot be imported for some reason.
+    implementation cannot be imported for some reason. Memoised per name,
+    so repeat calls skip the logger lookup and level/propagate writes.
     """
     root_name = "gpt_review"
     root = logging.getLogger(root_name)
     if not root.handlers:
         root.setLevel(logging.DEBUG)
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.INFO)
-        fmt = logging.Formatter(
-            fmt="%(asctime)s | %(name)s | %(process)d | %(levelname)-8s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        ch.setFormatter(fmt)
-        root.addHandler(ch)
+        root.addHandler(_fallback_handler())
         root.propagate = False
-        root.debug("Fallback logger initialised in gpt_review/__init__.py.")
     if name is None or name == root_name:
         return root
     logger = logging.getLogger(name)
@@ -63,41 +71,40 @@ def _fallback_get_logger(name: Optional[str] = None) -> logging.Logger:
     logger.propagate = True
     return logger
 
-# Choose the effective accessor and initialise the root once
-_effective_get_logger = _delegate_get_logger or _fallback_get_logger
-_ROOT_LOGGER = _effective_get_logger(None)  # configure "gpt_review" root
-_ROOT_LOGGER.debug("Logger initialised in %s", __name__)
+
+def _resolve_get_logger() -> Callable[[Optional[str]], logging.Logger]:
+    """
+    Import the packaged logger accessor, or return the fallback if that
+    import fails (broken install, partial environment).
+    """
+    try:
+        # Primary: packaged implementation (expected in normal installs)
+        from gpt_review.logger import get_logger as delegate  # type: ignore
+    except Exception:  # pragma: no cover
+        return _fallback_get_logger
+    return delegate
 
 # -----------------------------------------------------------------------------
 # Version helpers
 # -----------------------------------------------------------------------------
-try:
-    __version__: str = _pkg_version("gpt-review")
-except PackageNotFoundError:
-    # Editable installs (pip install -e .) may lack distribution metadata.
-    # Keep this fallback in sync with pyproject.toml
-    __version__ = "0.3.0"
-    _ROOT_LOGGER.warning(
-        "Package metadata not found – using fallback version %s", __version__
-    )
-
 def get_version() -> str:
     """Return the package version string."""
     return __version__
 
 # -----------------------------------------------------------------------------
-# Logger accessor (public re‑export)
+# Lazy public attributes (PEP 562)
 # -----------------------------------------------------------------------------
-def get_logger(name: str | None = None) -> logging.Logger:
+def __getattr__(name: str) -> Any:
     """
-    Return a logger configured with GPT‑Review's handlers & formatting.
-
-    Parameters
-    ----------
-    name : str | None
-        • Explicit module logger name (e.g., __name__) or None for the root
-          project logger "gpt_review".
+    Resolve `get_logger` on first access so `gpt_review.logger` is only
+    imported when somebody actually asks for a logger. The result is cached
+    in module globals, so later lookups never reach this hook.
     """
-    return _effective_get_logger(name)
+    if name == "get_logger":
+        accessor = _resolve_get_logger()
+        globals()["get_logger"] = accessor
+        return accessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["__version__", "get_version", "get_logger"]
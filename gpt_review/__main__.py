@@ -24,67 +24,64 @@ Keeping this entry point robust ensures both `python -m gpt_review` and the
 """
 from __future__ import annotations
 
-import argparse
-import platform
+import functools
+import logging
+import os
 import sys
-from importlib.metadata import PackageNotFoundError, version as _pkg_version
-from pathlib import Path
 from typing import Callable
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# CLI pre‑parsing (global flags only)
+# CLI pre‑scan (global flags only)
 # ─────────────────────────────────────────────────────────────────────────────
-def _parse_cli(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+def _wants_version(argv: list[str]) -> bool:
     """
-    Extract global flags (currently just --version) and leave the rest
-    for the real CLI driver to parse.
-
-    Returns
-    -------
-    (parsed_args, remaining_argv)
+    True if the global `--version` flag appears in *argv* (before any `--`
+    end‑of‑options marker). Everything else is left untouched for the real
+    CLI driver, which parses and validates the full argument vector itself.
     """
-    parser = argparse.ArgumentParser(
-        prog="python -m gpt_review",
-        add_help=False,  # The CLI provides full usage/help.
-    )
-    parser.add_argument(
-        "--version", action="store_true", help="Print package version and exit."
-    )
-    args, remainder = parser.parse_known_args(argv)
-    return args, remainder
+    end = argv.index("--") if "--" in argv else len(argv)
+    return "--version" in argv[:end]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Version resolution
 # ─────────────────────────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=1)
 def _resolve_version() -> str:
     """
-    Resolve the installed package version **without importing** gpt_review.
+    Resolve the package version from the build‑time constant in
+    `gpt_review/_version.py` (the same value pyproject stamps into the
+    distribution), so no `importlib.metadata` scan is needed.
 
-    Falls back to importing `gpt_review.__version__` only when distribution
-    metadata is unavailable (e.g., editable installs).
+    Falls back to distribution metadata only if that module is missing
+    (e.g., a partial install). Memoised.
     """
     try:
-        return _pkg_version("gpt-review")
-    except PackageNotFoundError:
-        try:
-            from gpt_review import __version__  # type: ignore
-        except Exception:
-            __version__ = "0.0.0"  # Last‑resort constant; keeps CLI usable.
+        from gpt_review._version import __version__
+
         return __version__
+    except ImportError:
+        from importlib.metadata import PackageNotFoundError, version as _pkg_version
+
+        try:
+            return _pkg_version("gpt-review")
+        except PackageNotFoundError:
+            return "0.0.0"  # Last‑resort constant; keeps CLI usable.
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Logging banner
 # ─────────────────────────────────────────────────────────────────────────────
-def _print_banner(version: str) -> None:
+def _print_banner(log: logging.Logger, version: str) -> None:
     """
     Log a concise runtime banner. Helpful in pasted logs and CI output.
+    Skipped (no platform probing) when the logger filters INFO out.
     """
-    from gpt_review import get_logger  # Local import keeps --version path fast.
+    if not log.isEnabledFor(logging.INFO):
+        return
+    import platform  # Local import keeps the --version path fast.
 
-    log = get_logger(__name__)
     log.info(
         "GPT‑Review %s  |  Python %s  |  %s",
         version,
@@ -96,43 +93,37 @@ def _print_banner(version: str) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 # Driver import (CLI preferred; legacy fallbacks)
 # ─────────────────────────────────────────────────────────────────────────────
+# Candidate drivers in preference order: (module, attribute).
+_DRIVER_CANDIDATES: tuple[tuple[str, str], ...] = (
+    ("gpt_review.cli", "main"),  # modern CLI
+    ("review", "main"),  # historical top‑level module
+    ("gpt_review.review", "main"),  # namespaced legacy
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _import_driver_main() -> Callable[[], int | None]:
     """
-    Locate the concrete CLI driver to execute.
-
-    Preference order:
-      1) gpt_review.cli.main          (modern CLI)
-      2) review.main                   (historical top‑level module)
-      3) gpt_review.review.main        (namespaced legacy)
+    Locate the concrete CLI driver to execute: the first importable entry of
+    `_DRIVER_CANDIDATES`. Missing modules are skipped via `find_spec`, which
+    is far cheaper than a failing import. Memoised for repeated in‑process
+    entry (tests, embedding); a failed lookup raises ImportError listing every
+    candidate, and exceptions are not cached.
     """
-    # 1) Preferred modern CLI
-    try:
-        from gpt_review.cli import main as cli_main  # type: ignore
-        return cli_main
-    except Exception as exc_first:  # pragma: no cover
-        # 2) Legacy top‑level `review`
+    from importlib import import_module
+    from importlib.util import find_spec
+
+    failures: list[str] = []
+    for module, attr in _DRIVER_CANDIDATES:
         try:
-            from review import main as review_main  # type: ignore
-            return review_main
-        except Exception as exc_second:  # pragma: no cover
-            # 3) Legacy namespaced `gpt_review.review`
-            try:
-                from gpt_review.review import main as review_ns_main  # type: ignore
-                return review_ns_main
-            except Exception as exc_third:  # pragma: no cover
-                # Log all failures coherently and exit.
-                from gpt_review import get_logger
-
-                get_logger(__name__).exception(
-                    "Failed to import CLI driver:\n"
-                    "  • gpt_review.cli.main         → %s\n"
-                    "  • review.main                 → %s\n"
-                    "  • gpt_review.review.main      → %s",
-                    exc_first,
-                    exc_second,
-                    exc_third,
-                )
-                sys.exit(1)
+            if find_spec(module) is None:
+                failures.append(f"  • {module}.{attr} → module not found")
+                continue
+            return getattr(import_module(module), attr)
+        except Exception as exc:  # pragma: no cover
+            failures.append(f"  • {module}.{attr} → {exc}")
+
+    raise ImportError("\n".join(failures))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -146,21 +137,30 @@ def main() -> None:
     * Print runtime banner
     * Delegate *all remaining args* to the CLI driver
     """
-    args, remaining = _parse_cli(sys.argv[1:])
-
-    # Fast path: print version and exit without importing heavy modules.
-    if args.version:
+    # `--version`: answered by a linear scan, no parser is built.
+    remaining = sys.argv[1:]
+    if _wants_version(remaining):
         print(_resolve_version())
         sys.exit(0)
 
-    # Normal path: banner + dispatch to CLI driver.
+    # Normal path: banner + dispatch to CLI driver. One logger serves the
+    # banner, driver lookup and the error handlers below.
+    from gpt_review import get_logger
+
+    log = get_logger(__name__)
     version = _resolve_version()
-    _print_banner(version)
+    _print_banner(log, version)
 
-    driver_main = _import_driver_main()
+    try:
+        driver_main = _import_driver_main()
+    except ImportError as exc:
+        # Log all failures coherently and exit.
+        log.error("Failed to import CLI driver:\n%s", exc)
+        sys.exit(1)
 
-    # Ensure the driver sees the expected argv vector.
-    sys.argv = [Path(sys.argv[0]).as_posix(), *remaining]
+    # Ensure the driver sees the expected argv vector (argv[0] in POSIX form).
+    argv0 = sys.argv[0] if os.sep == "/" else sys.argv[0].replace(os.sep, "/")
+    sys.argv = [argv0, *remaining]
 
     try:
         rc = driver_main()
@@ -170,14 +170,10 @@ def main() -> None:
         # Preserve intended exit codes from the underlying CLI.
         raise
     except KeyboardInterrupt:
-        from gpt_review import get_logger
-
-        get_logger(__name__).info("Interrupted by user (Ctrl‑C). Exiting.")
+        log.info("Interrupted by user (Ctrl‑C). Exiting.")
         sys.exit(130)
     except Exception as exc:  # pragma: no cover
-        from gpt_review import get_logger
-
-        get_logger(__name__).exception("Unhandled error in CLI driver: %s", exc)
+        log.exception("Unhandled error in CLI driver: %s", exc)
         sys.exit(1)
 
 
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+GPT‑Review ▸ Version constant
+===============================================================================
+
+Single source of truth for the package version. `pyproject.toml` reads this
+value at build time (`[tool.setuptools.dynamic]`), so wheels, sdists and
+editable installs all report the same string without a runtime
+`importlib.metadata` scan.
+"""
+__version__ = "0.3.0"
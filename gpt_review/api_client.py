@@ -25,6 +25,13 @@ Design notes
   parse defensively: try JSON first, then a crude first‑[`[ .. ]`] extraction.
 • Context pruning keeps cost down; callers can add an overview message via
   `.note(...)` before iteration 1.
+• With `stable_tool_prefix`, every request sends the same tool list (the
+  call is picked with `tool_choice`; JSON‑array requests pass "none"), so
+  together with the fixed system prompt and first note the request prefix is
+  byte‑identical across calls and vendor prompt caching can reuse it.
+• The client is synchronous by design. The orchestrator reviews one file at
+  a time over a single shared conversation, so there is no independent work
+  to fan out; an async variant would be API surface with no caller.
 
 Environment
 -----------
@@ -32,17 +39,27 @@ GPT_CODEX_API_KEY        – required (falls back to legacy OPENAI_API_KEY)
 GPT_CODEX_BASE_URL       – optional custom endpoint (aliases: GPT_CODEX_API_BASE,
                            OPENAI_BASE_URL, OPENAI_API_BASE)
 GPT_REVIEW_CTX_TURNS     – max assistant/tool “turn pairs” to retain (default 6)
+GPT_REVIEW_CTX_TOKENS    – approx. token budget for the history after the
+                           system prompt + first note (default 8000; 0 = off)
+GPT_REVIEW_API_RETRIES   – retries for rate‑limited/transient request failures
+                           (default 2; exponential backoff with jitter)
+GPT_REVIEW_STREAM_TOOLS  – "1" streams tool calls (default off; see
+                           `CodexClient.stream_tools`)
+GPT_REVIEW_STABLE_TOOL_PREFIX – "1" sends every tool with every request
+                           (default off; see `CodexClient.stable_tool_prefix`)
 
 Compatibility
 -------------
 This module preserves the legacy helper functions:
 
     strict_json_array(client, prompt) -> list[dict]
+    strict_json_arrays(client, prompts) -> list[list[dict]]   (one request)
     submit_patch_call(client, prompt, *, rel_path, expected_kind="update") -> dict
 
 and an object interface:
 
     CodexClient(...).ask_json_array(...)
+    CodexClient(...).ask_json_arrays(...)
     CodexClient(...).call_submit_patch(...)
     CodexClient(...).call_propose_review_plan(...)
     CodexClient(...).call_propose_error_fixes(...)
@@ -54,9 +71,22 @@ INFO for high‑level flow; DEBUG for detailed diagnostics.
 from __future__ import annotations
 
 import json
+import logging
 import os
+import random
+import re
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Optional fast JSON parser (pip install .[fast]); tool arguments carry whole
+# file bodies, which orjson decodes several times faster. Its decode error
+# subclasses json.JSONDecodeError (a ValueError).
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
 
 from gpt_review import get_logger
 from gpt_review.codex_client import (
@@ -71,6 +101,19 @@ log = get_logger(__name__)
 # Tunables
 # ─────────────────────────────────────────────────────────────────────────────
 DEFAULT_CTX_TURNS = int(os.getenv("GPT_REVIEW_CTX_TURNS", "6"))
+DEFAULT_CTX_TOKENS = int(os.getenv("GPT_REVIEW_CTX_TOKENS", "8000"))
+DEFAULT_API_RETRIES = int(os.getenv("GPT_REVIEW_API_RETRIES", "2"))
+DEFAULT_STREAM_TOOLS = os.getenv("GPT_REVIEW_STREAM_TOOLS", "").strip().lower() in {"1", "true", "yes", "on"}
+DEFAULT_STABLE_TOOL_PREFIX = os.getenv("GPT_REVIEW_STABLE_TOOL_PREFIX", "").strip().lower() in {"1", "true", "yes", "on"}
+
+_json_loads = _orjson.loads if _orjson is not None else json.loads
+_ARRAY_TOKEN_RE = re.compile(r'[\[\]"\\]')  # the only chars the array scanner acts on
+_MSG_OVERHEAD_TOKENS = 4  # role/framing tokens per message in the budget estimate
+
+_RETRY_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+_RETRY_EXC_NAMES = frozenset({"APITimeoutError", "APIConnectionError", "RateLimitError"})
+_RETRY_BASE_S = 1.0
+_RETRY_CAP_S = 30.0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -204,28 +247,154 @@ def _system_prompt() -> str:
     )
 
 
+# Built once at import: the schemas and prompt never change, so every request
+# reuses the same objects. The factories stay for callers that want a fresh
+# (mutable) copy, e.g. gpt_review.prompts.
+_SUBMIT_PATCH_TOOL: Dict[str, Any] = _submit_patch_tool()
+_PROPOSE_REVIEW_PLAN_TOOL: Dict[str, Any] = _propose_review_plan_tool()
+_PROPOSE_ERROR_FIXES_TOOL: Dict[str, Any] = _propose_error_fixes_tool()
+_SYSTEM_PROMPT: str = _system_prompt()
+# Sent with every request under `stable_tool_prefix` (tool_choice picks the
+# one to call): tools precede the messages in the prompt, so a fixed list
+# keeps the cached prefix intact.
+_ALL_TOOLS: List[Dict[str, Any]] = [
+    _SUBMIT_PATCH_TOOL,
+    _PROPOSE_REVIEW_PLAN_TOOL,
+    _PROPOSE_ERROR_FIXES_TOOL,
+]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
-# Helpers – context pruning & array extraction
+# Helpers – retries, context pruning & array extraction
 # ─────────────────────────────────────────────────────────────────────────────
-def _prune_messages(msgs: List[Dict[str, Any]], max_turn_pairs: int) -> List[Dict[str, Any]]:
+def _approx_tokens(msg: Dict[str, Any]) -> int:
+    """
+    Cheap token estimate for one message: ~4 characters per token of
+    content plus a fixed framing overhead.
+    """
+    return (len(msg.get("content") or "") >> 2) + _MSG_OVERHEAD_TOKENS
+
+
+def _prune_messages(
+    msgs: List[Dict[str, Any]], max_turn_pairs: int, max_tokens: int = 0
+) -> List[Dict[str, Any]]:
     """
     Keep system + initial user notes, plus the last *approximate* set of
     assistant/tool pairs. This is an approximation that works well for our bounded flows.
+
+    With *max_tokens* > 0 the tail is also capped by an approximate token
+    budget (see `_approx_tokens`), counted back from the newest message; the
+    newest message is always kept. A few huge file bodies then push out old
+    turns, while many small ones are not pruned early.
+
+    Trims *msgs* in place (one `del` of the oldest slice, no list rebuild)
+    and returns it, so callers may keep assigning the result.
     """
-    if len(msgs) <= 2:
+    # Keep ~2 * max_turn_pairs tail messages (with slack) after the head
+    slack = 2
+    approx = 2 * max_turn_pairs + slack
+    tail_len = len(msgs) - 2
+    if tail_len <= 1:
+        return msgs  # nothing prunable: the newest message is always kept
+    excess = tail_len - approx
+    if max_tokens > 0:
+        budget = max_tokens
+        kept = 0
+        for m in islice(reversed(msgs), min(tail_len, approx)):
+            budget -= _approx_tokens(m)
+            if budget < 0 and kept:
+                break
+            kept += 1
+        excess = max(excess, tail_len - kept)
+    if excess <= 0:
         return msgs
-    head = msgs[:2]
-    tail = msgs[2:]
 
-    # Count assistant/tool markers in tail; keep ~2 * max_turn_pairs (with slack)
-    indices = [i for i, m in enumerate(tail) if m.get("role") in ("assistant", "tool")]
-    if not indices:
+    # Only prune once the tail actually holds assistant/tool turns
+    if not any(m.get("role") in ("assistant", "tool") for m in islice(msgs, 2, None)):
         return msgs
 
-    slack = 2
-    approx = 2 * max_turn_pairs + slack
-    pruned_tail = tail[-approx:]
-    return head + pruned_tail
+    del msgs[2 : 2 + excess]
+    return msgs
+
+
+def _retry_delay(exc: Exception, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying after *exc*, or None if it is not
+    transient. HTTP errors retry on `_RETRY_STATUSES` (SDK‑agnostic: reads
+    `status_code` on the error or its `response`) and honour a numeric
+    `retry-after` header; other errors only on timeout/connection types.
+    Otherwise: full‑jitter exponential backoff capped at `_RETRY_CAP_S`.
+    """
+    resp = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None) or getattr(resp, "status_code", None)
+    if isinstance(status, int):
+        if status not in _RETRY_STATUSES:
+            return None
+    elif not (
+        isinstance(exc, (TimeoutError, ConnectionError))
+        or type(exc).__name__ in _RETRY_EXC_NAMES
+    ):
+        return None
+
+    headers = getattr(resp, "headers", None)
+    retry_after = headers.get("retry-after") if headers is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_CAP_S)
+        except ValueError:
+            pass  # HTTP‑date form: fall back to backoff
+    return random.uniform(0.0, min(_RETRY_CAP_S, _RETRY_BASE_S * (2 ** attempt)))
+
+
+def _with_retries(call: Callable[[], Any], what: str, retries: int) -> Any:
+    """
+    Run *call*, retrying up to *retries* times on transient failures
+    (see `_retry_delay`). The last error, or any non‑transient one, is raised.
+    """
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except Exception as exc:
+            delay = _retry_delay(exc, attempt) if attempt < retries else None
+            if delay is None:
+                raise
+            attempt += 1
+            log.warning(
+                "GPT-Codex %s failed (%s); retry %d/%d in %.1fs",
+                what, exc, attempt, retries, delay,
+            )
+            time.sleep(delay)
+
+
+def _balanced_arrays(text: str) -> Iterator[str]:
+    """
+    Yield each top‑level balanced `[...]` span of *text* in order. Brackets
+    inside JSON string literals (within a span) are ignored; the scan jumps
+    between bracket/quote/backslash characters via `_ARRAY_TOKEN_RE`.
+    """
+    depth = 0
+    start = -1
+    in_str = False
+    escaped_at = -1
+    for m in _ARRAY_TOKEN_RE.finditer(text):
+        i = m.start()
+        ch = text[i]
+        if in_str:
+            if ch == "\\" and escaped_at != i:
+                escaped_at = i + 1  # the next char is escaped
+            elif ch == '"' and escaped_at != i:
+                in_str = False
+        elif ch == '"':
+            in_str = depth > 0
+        elif ch == "[":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "]" and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start : i + 1]
 
 
 def _extract_json_array(text: str) -> List[Any]:
@@ -233,18 +402,22 @@ def _extract_json_array(text: str) -> List[Any]:
     Best‑effort extraction of a JSON array from *text*.
 
     Strategy:
-      1) If the entire content parses to a list → return it.
+      1) If the entire content (starting with '[') parses to a list → return it.
       2) Otherwise, scan for the **first** '[' and the **last** ']' and try to
          parse that slice. This addresses common stray prose cases.
-      3) On failure, raise ValueError with a concise snippet.
+      3) Otherwise, try each balanced top‑level `[...]` span in turn (handles
+         prose that itself contains brackets, e.g. "[note] … [ {...} ]").
+      4) On failure, raise ValueError with a concise snippet.
     """
-    # 1) Straight parse
-    try:
-        val = json.loads(text)
-        if isinstance(val, list):
-            return val
-    except Exception:
-        pass
+    # 1) Straight parse – only when the text can be a bare array at all, so
+    #    prose‑prefixed replies skip a guaranteed parse failure.
+    if text.lstrip()[:1] == "[":
+        try:
+            val = _json_loads(text)
+            if isinstance(val, list):
+                return val
+        except Exception:
+            pass
 
     # 2) Substring try
     first = text.find("[")
@@ -252,19 +425,91 @@ def _extract_json_array(text: str) -> List[Any]:
     if first != -1 and last != -1 and last > first:
         blob = text[first : last + 1]
         try:
-            val = json.loads(blob)
+            val = _json_loads(blob)
             if isinstance(val, list):
                 return val
         except Exception:
             pass
 
-    # 3) Fail with context for debugging
+    # 3) Balanced spans (string‑aware)
+    for blob in _balanced_arrays(text):
+        try:
+            val = _json_loads(blob)
+        except Exception:
+            continue
+        if isinstance(val, list):
+            return val
+
+    # 4) Fail with context for debugging
     snippet = text.strip().replace("\n", " ")
     if len(snippet) > 240:
         snippet = snippet[:240] + "…"
     raise ValueError(f"Assistant did not return a valid JSON array. Got: {snippet!r}")
 
 
+def _collect_tool_stream(stream: Any) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Drain a streamed chat completion into (content, tool_calls). Tool calls
+    come back as plain `{"id", "type", "function"}` dicts; each call's
+    `arguments` deltas are gathered in a list and joined once.
+    """
+    content: List[str] = []
+    calls: Dict[int, Dict[str, Any]] = {}
+    arg_parts: Dict[int, List[str]] = {}
+    for chunk in stream:
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            continue
+        delta = getattr(choices[0], "delta", None)
+        if delta is None:
+            continue
+        text = getattr(delta, "content", None)
+        if text:
+            content.append(text)
+        for tc in getattr(delta, "tool_calls", None) or ():
+            idx = getattr(tc, "index", None) or 0
+            call = calls.get(idx)
+            if call is None:
+                call = calls[idx] = {"id": None, "type": "function", "function": {"name": None}}
+                arg_parts[idx] = []
+            if getattr(tc, "id", None):
+                call["id"] = tc.id
+            fn = getattr(tc, "function", None)
+            if fn is not None:
+                if getattr(fn, "name", None):
+                    call["function"]["name"] = fn.name
+                if getattr(fn, "arguments", None):
+                    arg_parts[idx].append(fn.arguments)
+    for idx, call in calls.items():
+        call["function"]["arguments"] = "".join(arg_parts[idx])
+    return "".join(content), [calls[i] for i in sorted(calls)]
+
+
+def _tool_call_note(tool_name: str, args: Any) -> str:
+    """Transcript placeholder for a tool call, e.g. "[…submit_patch: op=update file=a.py…]"."""
+    fields = ""
+    if isinstance(args, dict):
+        if isinstance(args.get("edits"), list):
+            fields = f"edits={len(args['edits'])}"
+        else:
+            fields = " ".join(
+                f"{k}={args[k]}" for k in ("op", "file", "target", "status") if isinstance(args.get(k), str)
+            )
+    return f"[…{tool_name}: {fields}…]" if fields else f"[…{tool_name} call…]"
+
+
+def _as_dict_items(arr: List[Any]) -> List[dict]:
+    """Enforce dict items (most callers expect array[dict]); wrap anything else."""
+    out: List[dict] = []
+    for i, item in enumerate(arr, 1):
+        if isinstance(item, dict):
+            out.append(item)
+        else:
+            log.warning("Array item %d is not an object; coercing via wrapper.", i)
+            out.append({"value": item})
+    return out
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Client
 # ─────────────────────────────────────────────────────────────────────────────
@@ -281,6 +526,23 @@ class CodexClient:
         Per‑request timeout in seconds.
     max_turn_pairs : int
         Rolling history window (assistant/tool pairs retained).
+    max_ctx_tokens : int
+        Approximate token budget for the history after the system prompt and
+        first note (0 disables the budget; the turn window still applies).
+    max_retries : int
+        Retries per request on rate limits (429), 5xx and timeouts (a
+        streamed reply is retried as a whole). When > 0 the SDK's own
+        retries are switched off where the SDK allows it, so attempts do not
+        multiply.
+    stream_tools : bool
+        Request tool calls with `stream=True` and assemble the arguments from
+        the deltas. Large file bodies then arrive over a live stream instead
+        of one long‑blocking response; the SDK must support streaming.
+    stable_tool_prefix : bool
+        Send all tools with every request, including JSON‑array requests
+        (with `tool_choice="none"`), so the prompt prefix stays identical and
+        vendor prompt caching can reuse it. Off by default: each tool call
+        then sends only its own tool and array requests send none.
     messages : list[dict]
         Conversation buffer. Starts with a system prompt; `.note(...)`
         appends a user message.
@@ -289,19 +551,24 @@ class CodexClient:
     model: str
     timeout_s: int = 120
     max_turn_pairs: int = DEFAULT_CTX_TURNS
+    max_ctx_tokens: int = DEFAULT_CTX_TOKENS
+    max_retries: int = DEFAULT_API_RETRIES
+    stream_tools: bool = DEFAULT_STREAM_TOOLS
+    stable_tool_prefix: bool = DEFAULT_STABLE_TOOL_PREFIX
     messages: List[Dict[str, Any]] = field(default_factory=list)
 
     # Internal: SDK client instance (lazy)
     _sdk: Any | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.messages = [{"role": "system", "content": _system_prompt()}]
-        log.info(
-            "GPT-Codex client initialised | model=%s | timeout=%ss | base=%s",
-            self.model,
-            self.timeout_s,
-            resolve_codex_base_url() or "<default>",
-        )
+        self.messages = [{"role": "system", "content": _SYSTEM_PROMPT}]
+        if log.isEnabledFor(logging.INFO):  # base URL lookup reads the env
+            log.info(
+                "GPT-Codex client initialised | model=%s | timeout=%ss | base=%s",
+                self.model,
+                self.timeout_s,
+                resolve_codex_base_url() or "<default>",
+            )
 
     # --- SDK bootstrap ----------------------------------------------------- #
     def _ensure_sdk(self) -> Any:
@@ -314,21 +581,34 @@ class CodexClient:
                 "GPT_CODEX_API_KEY is not set in the environment (legacy OPENAI_API_KEY is also checked)."
             )
 
-        self._sdk = create_codex_client(self.timeout_s)
+        # `_with_retries` owns retrying; keep the SDK from retrying each attempt too.
+        self._sdk = create_codex_client(
+            self.timeout_s, max_retries=0 if self.max_retries > 0 else None
+        )
         return self._sdk
 
     # --- Conversation helpers --------------------------------------------- #
+    def _prune(self) -> None:
+        """Apply the turn window and token budget to `messages` (in place)."""
+        _prune_messages(self.messages, self.max_turn_pairs, self.max_ctx_tokens)
+
     def note(self, user_content: str) -> None:
         """
         Append a *user* message (e.g., an overview prompt) to the buffer.
+
+        The first note, sent before any call, sits right after the system
+        prompt and is never pruned, so together they form a stable request
+        prefix that vendor prompt caches discount on every later call. Put
+        long‑lived context (manifest, rules) there and keep it unchanged.
         """
         self.messages.append({"role": "user", "content": user_content})
-        self.messages = _prune_messages(self.messages, self.max_turn_pairs)
-        log.debug(
-            "Added overview/user note (%d chars); messages=%d",
-            len(user_content or ""),
-            len(self.messages),
-        )
+        self._prune()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Added overview/user note (%d chars); messages=%d",
+                len(user_content) if user_content is not None else 0,
+                len(self.messages),
+            )
 
     # --- Internal: generic tool call -------------------------------------- #
     def _call_tool_only(self, tool_schema: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
@@ -338,31 +618,53 @@ class CodexClient:
         """
         sdk = self._ensure_sdk()
         tool_name = tool_schema["function"]["name"]
-        try:
+        def request() -> Any:
             resp = sdk.chat.completions.create(
                 model=self.model,
                 messages=self.messages,
                 temperature=0,
-                tools=[tool_schema],
+                tools=_ALL_TOOLS if self.stable_tool_prefix else [tool_schema],
                 tool_choice={"type": "function", "function": {"name": tool_name}},
                 timeout=self.timeout_s,  # type: ignore[call-arg]
+                **({"stream": True} if self.stream_tools else {}),
             )
+            # A stream is drained inside the retried call, so a 5xx or a
+            # disconnect mid‑stream is retried like a failed create().
+            return _collect_tool_stream(resp) if self.stream_tools else resp
+
+        try:
+            resp = _with_retries(request, f"request (tool={tool_name})", self.max_retries)
         except Exception as exc:
             log.exception("GPT-Codex request (tool=%s) failed: %s", tool_name, exc)
             raise
 
+        # Bind each response field once; a generic SDK may still return an
+        # unexpected shape, so the lookups stay under one (success‑path cheap) guard.
+        fn_name: Optional[str] = None
+        raw_args = ""
+        call_id: Optional[str] = None
         try:
-            choice = resp.choices[0]
-            msg = choice.message
-            calls = getattr(msg, "tool_calls", None) or []
+            if self.stream_tools:
+                content, calls = resp
+                if calls:
+                    call = calls[0]
+                    fn = call["function"]
+                    fn_name, raw_args, call_id = fn["name"], fn["arguments"], call["id"]
+            else:
+                msg = resp.choices[0].message
+                content = msg.content or ""
+                calls = getattr(msg, "tool_calls", None)
+                if calls:
+                    tc = calls[0]
+                    fn = tc.function
+                    fn_name, raw_args, call_id = fn.name, fn.arguments or "", tc.id
         except Exception as exc:
             raise RuntimeError(f"Malformed API response (tool={tool_name}): {exc}") from exc
 
         if not calls:
             # Record assistant content to aid debugging and raise with a snippet.
-            content = msg.content or ""
             self.messages.append({"role": "assistant", "content": content})
-            self.messages = _prune_messages(self.messages, self.max_turn_pairs)
+            self._prune()
             snippet = content.strip().replace("\n", " ")
             if len(snippet) > 240:
                 snippet = snippet[:240] + "…"
@@ -371,45 +673,51 @@ class CodexClient:
                 f"Last assistant message snippet: {snippet!r}"
             )
 
-        tc = calls[0]
-        fn = getattr(tc, "function", None)
-        fn_name = getattr(fn, "name", None)
-        raw_args = getattr(fn, "arguments", "") or ""
-        call_id = getattr(tc, "id", None) or "call_0"
-
-        # Keep assistant message (with tool_calls) in the transcript
-        self.messages.append(
-            {"role": "assistant", "content": msg.content or "", "tool_calls": calls}
-        )
-        self.messages = _prune_messages(self.messages, self.max_turn_pairs)
-
-        if fn_name != tool_name:
-            raise RuntimeError(f"Unexpected function name: {fn_name}")
+        call_id = call_id or "call_0"
 
+        args: Any = None
         try:
-            args = json.loads(raw_args)
-            log.info("Tool '%s' returned keys=%s", tool_name, sorted(args.keys()))
-        except Exception as exc:
-            raise RuntimeError(f"Failed to decode tool arguments as JSON: {exc}") from exc
-
+            if fn_name != tool_name:
+                raise RuntimeError(f"Unexpected function name: {fn_name}")
+            try:
+                args = _json_loads(raw_args)
+                if not isinstance(args, dict):
+                    raise TypeError(f"expected a JSON object, got {type(args).__name__}")
+            except Exception as exc:
+                raise RuntimeError(f"Failed to decode tool arguments as JSON: {exc}") from exc
+        finally:
+            # The transcript keeps a short stand‑in, not the call itself: the
+            # arguments can hold whole files and the call is never continued.
+            self.messages.append({"role": "assistant", "content": _tool_call_note(tool_name, args)})
+            self._prune()
+
+        if log.isEnabledFor(logging.INFO):
+            log.info("Tool '%s' returned keys=%s (call_id=%s)", tool_name, sorted(args), call_id)
         return args, call_id
 
     # --- Calls: strict JSON array ----------------------------------------- #
-    def ask_json_array(self, prompt: str) -> List[dict]:
+    def _request_json_array(self, prompt: str) -> List[Any]:
         """
-        Ask the assistant to return a strict JSON array (no prose).
-        The prompt should *explicitly* repeat that requirement.
+        Send *prompt* as a user turn and return the JSON array from the reply
+        (see `_extract_json_array`). The transcript keeps only a short
+        placeholder for the assistant answer.
         """
         sdk = self._ensure_sdk()
         self.messages.append({"role": "user", "content": prompt})
-        self.messages = _prune_messages(self.messages, self.max_turn_pairs)
+        self._prune()
 
         try:
-            resp = sdk.chat.completions.create(
-                model=self.model,
-                messages=self.messages,
-                temperature=0,
-                timeout=self.timeout_s,  # type: ignore[call-arg]
+            resp = _with_retries(
+                lambda: sdk.chat.completions.create(
+                    model=self.model,
+                    messages=self.messages,
+                    temperature=0,
+                    timeout=self.timeout_s,  # type: ignore[call-arg]
+                    # Same prefix as the tool calls; none may be called.
+                    **({"tools": _ALL_TOOLS, "tool_choice": "none"} if self.stable_tool_prefix else {}),
+                ),
+                "request for JSON array",
+                self.max_retries,
             )
         except Exception as exc:
             log.exception("GPT-Codex request for JSON array failed: %s", exc)
@@ -424,18 +732,42 @@ class CodexClient:
         arr = _extract_json_array(content)
         # Append assistant message to history; avoid clutter with huge arrays.
         self.messages.append({"role": "assistant", "content": f"[…JSON array: {len(arr)} items…]"})
-        self.messages = _prune_messages(self.messages, self.max_turn_pairs)
+        self._prune()
         log.info("Strict JSON array received with %d entries.", len(arr))
+        return arr
 
-        # Enforce dict items (most callers expect array[dict])
-        out: List[dict] = []
-        for i, item in enumerate(arr, 1):
-            if isinstance(item, dict):
-                out.append(item)
-            else:
-                log.warning("Array item %d is not an object; coercing via wrapper.", i)
-                out.append({"value": item})
-        return out
+    def ask_json_array(self, prompt: str) -> List[dict]:
+        """
+        Ask the assistant to return a strict JSON array (no prose).
+        The prompt should *explicitly* repeat that requirement.
+        """
+        return _as_dict_items(self._request_json_array(prompt))
+
+    def ask_json_arrays(self, prompts: List[str]) -> List[List[dict]]:
+        """
+        Answer several strict‑JSON‑array prompts with **one** request: the
+        tasks are numbered into a single user message and the reply must be
+        an array of arrays, one per task, in order. Saves a round trip (and a
+        re‑send of the history) per extra prompt.
+
+        Raises ValueError if the reply does not hold exactly one array per task.
+        """
+        if len(prompts) <= 1:
+            return [self.ask_json_array(p) for p in prompts]
+
+        tasks = "\n\n".join(f"Task {i}:\n{p}" for i, p in enumerate(prompts, 1))
+        combined = (
+            f"Answer each of the {len(prompts)} numbered tasks below. Reply with ONE strict "
+            f"JSON array holding exactly {len(prompts)} JSON arrays – the answer to each task, "
+            "in task order. No prose, no code fences.\n\n" + tasks
+        )
+        outer = self._request_json_array(combined)
+        if len(outer) != len(prompts) or not all(isinstance(a, list) for a in outer):
+            raise ValueError(
+                f"Expected a JSON array of {len(prompts)} arrays (one per task); "
+                f"got {len(outer)} item(s)."
+            )
+        return [_as_dict_items(arr) for arr in outer]
 
     # --- Calls: submit_patch ------------------------------------------------ #
     def call_submit_patch(self, user_prompt: str) -> Dict[str, Any]:
@@ -444,8 +776,8 @@ class CodexClient:
         as a plain dict. Schema validation is performed by the caller.
         """
         self.messages.append({"role": "user", "content": user_prompt})
-        self.messages = _prune_messages(self.messages, self.max_turn_pairs)
-        args, _ = self._call_tool_only(_submit_patch_tool())
+        self._prune()
+        args, _ = self._call_tool_only(_SUBMIT_PATCH_TOOL)
         return args
 
     # --- Calls: plan‑first -------------------------------------------------- #
@@ -454,8 +786,8 @@ class CodexClient:
         Force a tool call to `propose_review_plan` (plan‑first step).
         """
         self.messages.append({"role": "user", "content": user_prompt})
-        self.messages = _prune_messages(self.messages, self.max_turn_pairs)
-        args, _ = self._call_tool_only(_propose_review_plan_tool())
+        self._prune()
+        args, _ = self._call_tool_only(_PROPOSE_REVIEW_PLAN_TOOL)
         return args
 
     # --- Calls: error fixes ------------------------------------------------- #
@@ -464,8 +796,8 @@ class CodexClient:
         Force a tool call to `propose_error_fixes` for runtime errors.
         """
         self.messages.append({"role": "user", "content": user_prompt})
-        self.messages = _prune_messages(self.messages, self.max_turn_pairs)
-        args, _ = self._call_tool_only(_propose_error_fixes_tool())
+        self._prune()
+        args, _ = self._call_tool_only(_PROPOSE_ERROR_FIXES_TOOL)
         return args
 
 
@@ -479,6 +811,13 @@ def strict_json_array(client: CodexClient, prompt: str) -> List[dict]:
     return client.ask_json_array(prompt)
 
 
+def strict_json_arrays(client: CodexClient, prompts: List[str]) -> List[List[dict]]:
+    """
+    Convenience wrapper that delegates to `client.ask_json_arrays`.
+    """
+    return client.ask_json_arrays(prompts)
+
+
 def submit_patch_call(
     client: CodexClient,
     prompt: str,
@@ -535,5 +874,6 @@ def submit_patch_call(
 __all__ = [
     "CodexClient",
     "strict_json_array",
+    "strict_json_arrays",
     "submit_patch_call",
 ]
@@ -187,21 +187,60 @@ class _ChatCompletionsProxy:
 class CodexClientAdapter:
     """Expose `.chat.completions.create` by wrapping the raw SDK client."""
 
-    def __init__(self, sdk: Any, timeout: int | None = None) -> None:
+    def __init__(self, sdk: Any, timeout: int | None = None, http_client: Any = None) -> None:
         self._sdk = sdk
+        self._http_client = http_client
         self.chat = SimpleNamespace(completions=_ChatCompletionsProxy(sdk, timeout))
 
+    def close(self) -> None:
+        """Release pooled connections (no‑op when the SDK owns its transport)."""
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
     def __getattr__(self, item: str) -> Any:  # pragma: no cover - passthrough
         return getattr(self._sdk, item)
 
 
+# ---------------------------------------------------------------------------
+# HTTP transport
+# ---------------------------------------------------------------------------
+def _pooled_http_client(api_timeout: int) -> Any | None:
+    """
+    A keep‑alive `httpx.Client` shared by every request of one SDK client, so
+    sequential calls reuse the TCP/TLS connection instead of handshaking
+    each time. HTTP/2 is enabled when the `h2` extra is installed. Returns
+    None if httpx is unavailable (the SDK then uses its own transport).
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    try:
+        import h2  # noqa: F401  (httpx[http2])
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(api_timeout, connect=10.0),
+        http2=http2,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public factory
 # ---------------------------------------------------------------------------
 
 
-def create_client(api_timeout: int) -> CodexClientAdapter:
-    """Instantiate and wrap the gpt-5-codex SDK client."""
+def create_client(api_timeout: int, *, max_retries: int | None = None) -> CodexClientAdapter:
+    """
+    Instantiate and wrap the gpt-5-codex SDK client.
+
+    *max_retries* is passed to SDKs that take it (OpenAI‑style); callers with
+    their own retry loop pass 0 so attempts do not multiply. SDKs that reject
+    the keyword are built without it (and get the attribute if they have one).
+    """
     api_key = resolve_api_key()
     if not api_key:
         raise RuntimeError(
@@ -221,10 +260,36 @@ def create_client(api_timeout: int) -> CodexClientAdapter:
         for key in ("organization", "org_id", "tenant"):
             init_kwargs.setdefault(key, org_id)
 
+    # Hand the SDK a pooled transport when it accepts one (OpenAI‑style
+    # `http_client=`); otherwise fall through to the plain constructors.
+    retry_kwargs: dict[str, Any] = {"max_retries": max_retries} if max_retries is not None else {}
+    retries_set = False
+
+    sdk: Any = None
+    http_client = _pooled_http_client(api_timeout)
+    if http_client is not None:
+        for extra in ((retry_kwargs, {}) if retry_kwargs else ({},)):
+            try:
+                sdk = cls(api_key=api_key, http_client=http_client, **init_kwargs, **extra)
+                retries_set = bool(extra)
+                break
+            except Exception:
+                continue
+        if sdk is None:
+            http_client.close()
+            http_client = None
+
     # Always prefer explicit api_key but fall back to attribute assignment
     # if the class does not accept it in the constructor.
     try:
-        sdk = cls(api_key=api_key, **init_kwargs)
+        if sdk is None and retry_kwargs:
+            try:
+                sdk = cls(api_key=api_key, **init_kwargs, **retry_kwargs)
+                retries_set = True
+            except TypeError:
+                sdk = None
+        if sdk is None:
+            sdk = cls(api_key=api_key, **init_kwargs)
     except TypeError:
         try:
             sdk = cls(**init_kwargs)
@@ -241,11 +306,17 @@ def create_client(api_timeout: int) -> CodexClientAdapter:
     except Exception as exc:  # pragma: no cover - defensive
         raise RuntimeError("Failed to initialise gpt-5-codex client") from exc
 
+    if retry_kwargs and not retries_set and isinstance(getattr(sdk, "max_retries", None), int):
+        sdk.max_retries = max_retries
+        retries_set = True
+
     log.info(
-        "gpt-5-codex client initialised | base=%s",
+        "gpt-5-codex client initialised | base=%s | pooled=%s | sdk_retries=%s",
         base_url or "<default>",
+        http_client is not None,
+        max_retries if retries_set else "<sdk default>",
     )
-    return CodexClientAdapter(sdk, api_timeout)
+    return CodexClientAdapter(sdk, api_timeout, http_client)
 
 
 __all__ = [
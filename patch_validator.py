@@ -43,13 +43,14 @@ Design notes
     - `file`/`target` must be safe repo‑relative **POSIX** paths (no abs/backslashes/.., not .git/).
       Leading "./" is **not allowed** (aligns with api_driver/workflow). Windows drive letters are rejected.
     - `body_b64` (when present) must be valid Base64 (strict check).
+    - `body_path` (when present) must be absolute; apply_patch confines it to
+      the staging directory.
 * Logging is centralised via the project logger.
 """
 from __future__ import annotations
 
-import argparse
-import base64
 import json
+import os
 import re
 import sys
 from importlib import resources
@@ -59,6 +60,16 @@ from typing import Any, Dict
 import jsonschema
 from jsonschema import Draft7Validator, ValidationError
 
+# Optional fast JSON parser (pip install .[fast]); large `body` payloads parse
+# several times faster. orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None
+
+# Shared with apply_patch's CLI (batch arrays); accepts str or bytes.
+_json_loads = _orjson.loads if _orjson is not None else json.loads
+
 # Prefer the shim; it delegates to the packaged logger and avoids duplicate config.
 try:
     from logger import get_logger  # type: ignore
@@ -122,6 +133,26 @@ _ALLOWED_OPS = {"create", "update", "delete", "rename", "chmod"}
 _ALLOWED_STATUS = {"in_progress", "completed"}
 _MODE_RE = re.compile(r"^[0-7]{3,4}$")  # chmod mode (3 or 4 octal digits)
 _DRIVE_PREFIX_RE = re.compile(r"^[A-Za-z]:")  # Windows drive letter
+_B64_SLICE = 64 * 1024  # chars per base64 validation step (multiple of 4)
+
+
+def _is_strict_base64(b64: str) -> bool:
+    """
+    Same verdict as `base64.b64decode(b64, validate=True)`, but decoded in
+    `_B64_SLICE` pieces that are thrown away, so a large binary body is not
+    materialised just to be validated (apply_patch decodes it again while
+    writing). Padding is only legal at the very end.
+    """
+    import base64  # only binary payloads need it
+
+    if "=" in b64[:-2]:
+        return False
+    try:
+        for off in range(0, len(b64), _B64_SLICE):
+            base64.b64decode(b64[off : off + _B64_SLICE], validate=True)
+    except Exception:
+        return False
+    return True
 
 
 def _pretty_pointer(exc: ValidationError) -> str:
@@ -209,10 +240,11 @@ def _extra_safety_checks(data: Dict[str, Any]) -> None:
         if "body_b64" in data:
             b64 = data["body_b64"]
             _require(isinstance(b64, str) and b64.strip(), "'body_b64' must be a non‑empty Base64 string.")
-            try:
-                base64.b64decode(b64, validate=True)
-            except Exception:
-                raise ValueError("Invalid Base64 in 'body_b64'.")
+            _require(_is_strict_base64(b64), "Invalid Base64 in 'body_b64'.")
+        if "body_path" in data:
+            # Staging‑dir containment is enforced by the applier at runtime.
+            bp = data["body_path"]
+            _require(isinstance(bp, str) and os.path.isabs(bp), "'body_path' must be an absolute path.")
 
     elif op == "delete":
         _check_path_field("file")
@@ -256,11 +288,8 @@ def validate_patch(patch_json: str | bytes | Dict[str, Any]) -> Dict[str, Any]:
         If path/Base64 guards fail.
     """
     # Normalize input
-    if isinstance(patch_json, bytes):
-        patch_json = patch_json.decode()
-
-    if isinstance(patch_json, str):
-        data = json.loads(patch_json)
+    if isinstance(patch_json, (str, bytes)):
+        data = _json_loads(patch_json)
     elif isinstance(patch_json, dict):
         data = patch_json
     else:  # pragma: no cover
@@ -293,6 +322,8 @@ def _cli(argv: list[str] | None = None) -> int:
     int
         Exit code (0 ok, 1 error).
     """
+    import argparse  # CLI only; keep library imports light
+
     argv = argv if argv is not None else sys.argv[1:]
 
     parser = argparse.ArgumentParser(
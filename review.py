@@ -16,23 +16,24 @@ All functionality (browser, API, and multi‑iteration workflow) lives there.
 
 from __future__ import annotations
 
-import sys
-
-try:
-    # Prefer the modern CLI
-    from gpt_review.cli import main as _cli_main  # type: ignore
-except Exception as exc:  # pragma: no cover
-    # Fall back to a clear error rather than importing heavy legacy code
-    from logger import get_logger  # lightweight shim
-    log = get_logger(__name__)
-    log.exception("Failed to import gpt_review.cli. Is the package installed correctly?")
-    raise SystemExit(1) from exc
-
 
 def main() -> None:
     """
     Delegate to the modern CLI entry point.
+
+    The import is deferred so that merely importing this shim (or running
+    `--version` through the package entry point) does not pull in the full
+    review pipeline and its transitive dependencies.
     """
+    try:
+        # Prefer the modern CLI
+        from gpt_review.cli import main as _cli_main  # type: ignore
+    except Exception as exc:  # pragma: no cover
+        # Fall back to a clear error rather than importing heavy legacy code
+        from logger import get_logger  # lightweight shim
+        log = get_logger(__name__)
+        log.exception("Failed to import gpt_review.cli. Is the package installed correctly?")
+        raise SystemExit(1) from exc
     _cli_main()
 
 
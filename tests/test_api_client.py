@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline unit tests for the GPT-Codex client wrapper (`gpt_review.api_client`).
+
+Goals
+-----
+• JSON-array extraction copes with prose around the array and with brackets
+  inside JSON string literals (string-aware balanced scan).
+• `ask_json_arrays` answers several prompts with one request and rejects a
+  reply that does not hold exactly one array per task.
+• Tool definitions are only all sent (prefix-stable) when
+  `stable_tool_prefix` is on; by default each request sends its own tool.
+• Transient failures are retried – including a streamed reply that breaks
+  mid-read – and the SDK's own retries are switched off meanwhile.
+
+A fake SDK object is injected as the client's `_sdk`; no network access.
+
+Run with:
+    pytest -q tests/test_api_client.py
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from gpt_review.api_client import (
+    _ALL_TOOLS,
+    _SUBMIT_PATCH_TOOL,
+    CodexClient,
+    _balanced_arrays,
+    _extract_json_array,
+)
+
+
+# ───────────────────────────── helper fakes ──────────────────────────────────
+class _Obj:
+    """Simple attribute container to mimic SDK objects (choices/message)."""
+
+    def __init__(self, **kw):
+        for k, v in kw.items():
+            setattr(self, k, v)
+
+
+class _FakeCompletions:
+    def __init__(self, replies: List[str]):
+        """replies: assistant message texts returned in order."""
+        self._replies = list(replies)
+        self.calls: List[Dict[str, Any]] = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        msg = _Obj(role="assistant", content=self._replies.pop(0), tool_calls=None)
+        return _Obj(choices=[_Obj(message=msg)])
+
+
+def _client(replies: List[str]) -> CodexClient:
+    client = CodexClient(model="fake-model")
+    client._sdk = _Obj(chat=_Obj(completions=_FakeCompletions(replies)))
+    return client
+
+
+# ───────────────────────────── array extraction ──────────────────────────────
+def test_extract_array_with_brackets_inside_strings():
+    """
+    Prose brackets before the array defeat the first-'[' / last-']' slice;
+    the balanced scan must skip them and ignore brackets in string literals.
+    """
+    reply = 'Sure [note]: [{"path": "a[0].py", "why": "fix ]["}, {"path": "b\\"]\\".py"}] done'
+    assert _extract_json_array(reply) == [
+        {"path": "a[0].py", "why": "fix ]["},
+        {"path": 'b"]".py'},
+    ]
+    assert list(_balanced_arrays('x [1, "]"] y [2]')) == ['[1, "]"]', "[2]"]
+
+
+def test_extract_array_rejects_prose_only():
+    with pytest.raises(ValueError):
+        _extract_json_array("no array in this reply")
+
+
+# ───────────────────────────── batched arrays ────────────────────────────────
+def test_ask_json_arrays_one_request_for_several_prompts():
+    client = _client([json.dumps([[{"path": "a.py"}], [], [{"path": "c.py"}, 3]])])
+
+    out = client.ask_json_arrays(["files to add?", "files to drop?", "files to split?"])
+
+    assert out == [[{"path": "a.py"}], [], [{"path": "c.py"}, {"value": 3}]]
+    calls = client._sdk.chat.completions.calls
+    assert len(calls) == 1
+    prompt = calls[0]["messages"][-2]["content"]  # last user turn (before the placeholder)
+    assert "Task 1:" in prompt and "Task 3:" in prompt
+
+
+def test_ask_json_arrays_count_mismatch_raises():
+    client = _client([json.dumps([[{"path": "a.py"}]])])
+    with pytest.raises(ValueError):
+        client.ask_json_arrays(["first?", "second?"])
+
+
+# ───────────────────────────── tool prefix ───────────────────────────────────
+_PATCH_ARGS = '{"op": "update", "file": "a.py", "body": "x", "status": "completed"}'
+
+
+@pytest.mark.parametrize("stable", [False, True])
+def test_tools_sent_per_request(stable: bool):
+    """
+    By default a tool call sends only its own tool and an array request sends
+    none; `stable_tool_prefix` sends the full list with both.
+    """
+    calls: List[Dict[str, Any]] = []
+    tool_call = _Obj(id="c1", function=_Obj(name="submit_patch", arguments=_PATCH_ARGS))
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            msg = _Obj(role="assistant", content=None, tool_calls=[tool_call])
+        else:
+            msg = _Obj(role="assistant", content="[]", tool_calls=None)
+        return _Obj(choices=[_Obj(message=msg)])
+
+    client = CodexClient(model="fake-model", stable_tool_prefix=stable)
+    client._sdk = _Obj(chat=_Obj(completions=_Obj(create=create)))
+
+    client.call_submit_patch("fix a.py")
+    client.ask_json_array("files to add?")
+
+    patch_call, array_call = calls
+    assert patch_call["tool_choice"] == {"type": "function", "function": {"name": "submit_patch"}}
+    if stable:
+        assert patch_call["tools"] is _ALL_TOOLS
+        assert array_call["tools"] is _ALL_TOOLS and array_call["tool_choice"] == "none"
+    else:
+        assert patch_call["tools"] == [_SUBMIT_PATCH_TOOL]
+        assert "tools" not in array_call and "tool_choice" not in array_call
+
+
+# ───────────────────────────── retries ───────────────────────────────────────
+class _Flaky503(Exception):
+    status_code = 503
+
+
+def test_stream_failure_mid_read_is_retried(monkeypatch):
+    """
+    With stream_tools, a 5xx raised while the stream is being read is retried
+    like a failed create() – the whole request is sent again.
+    """
+    import gpt_review.api_client as api
+
+    monkeypatch.setattr(api.time, "sleep", lambda _s: None)
+
+    def chunk(**delta):
+        return _Obj(choices=[_Obj(delta=_Obj(content=None, **delta))])
+
+    def broken_stream():
+        yield chunk(tool_calls=[_Obj(index=0, id="c1", function=_Obj(name="submit_patch", arguments='{"op":'))])
+        raise _Flaky503("upstream reset")
+
+    good = [chunk(tool_calls=[_Obj(index=0, id="c2", function=_Obj(name="submit_patch", arguments=_PATCH_ARGS))])]
+    streams = [broken_stream(), iter(good)]
+    calls: List[Dict[str, Any]] = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return streams.pop(0)
+
+    client = CodexClient(model="fake-model", stream_tools=True, max_retries=2)
+    client._sdk = _Obj(chat=_Obj(completions=_Obj(create=create)))
+
+    assert client.call_submit_patch("fix a.py")["file"] == "a.py"
+    assert len(calls) == 2 and all(c["stream"] for c in calls)
+
+
+def test_create_client_turns_off_sdk_retries(monkeypatch):
+    """
+    `max_retries` reaches SDKs that accept it; SDKs that reject the keyword
+    are still built (without it).
+    """
+    import gpt_review.codex_client as cc
+
+    monkeypatch.setenv("GPT_CODEX_API_KEY", "test-key")
+    monkeypatch.setattr(cc, "_pooled_http_client", lambda _t: None)
+
+    class RetryingSDK:
+        def __init__(self, api_key, max_retries=2):
+            self.max_retries = max_retries
+
+    class PlainSDK:
+        def __init__(self, api_key):
+            self.api_key = api_key
+
+    monkeypatch.setattr(cc, "_load_sdk_class", lambda: RetryingSDK)
+    assert cc.create_client(30, max_retries=0)._sdk.max_retries == 0
+
+    monkeypatch.setattr(cc, "_load_sdk_class", lambda: PlainSDK)
+    assert cc.create_client(30, max_retries=0)._sdk.api_key == "test-key"
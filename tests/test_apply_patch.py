@@ -31,13 +31,15 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import os
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
 
 # System‑under‑test
-from apply_patch import apply_patch
+from apply_patch import apply_patch, apply_patches
 
 # -----------------------------------------------------------------------------
 # Logging – helpful when Git commands fail in CI
@@ -203,6 +205,180 @@ def test_binary_create(tmp_path: Path):
     log.info("Binary create test passed.")
 
 
+def test_binary_update_spanning_decode_chunks(tmp_path: Path):
+    """
+    A multi‑chunk body_b64 round‑trips exactly; re‑applying it is a no‑op.
+    """
+    repo = _init_repo(tmp_path)
+    blob = os.urandom(200_001)  # several 64 KiB base64 slices, padded tail
+    payload = base64.b64encode(blob).decode()
+
+    _apply({"op": "create", "file": "bin/blob.dat", "body_b64": "AAAA", "status": "in_progress"}, repo)
+    _apply({"op": "update", "file": "bin/blob.dat", "body_b64": payload, "status": "in_progress"}, repo)
+    assert (repo / "bin/blob.dat").read_bytes() == blob
+
+    before = _commit_count(repo)
+    _apply({"op": "update", "file": "bin/blob.dat", "body_b64": payload, "status": "completed"}, repo)
+    assert _commit_count(repo) == before
+
+
+def test_staged_body_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    body_path copies a staged file verbatim; paths outside staging are refused.
+    """
+    repo = _init_repo(tmp_path)
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    monkeypatch.setenv("GPT_REVIEW_STAGING_DIR", str(staging))
+    blob = os.urandom(300_000) + b"\r\n"  # verbatim: no EOL normalization
+    (staging / "big.bin").write_bytes(blob)
+
+    _apply({"op": "create", "file": "big.bin", "body_path": str(staging / "big.bin"), "status": "in_progress"}, repo)
+    assert (repo / "big.bin").read_bytes() == blob
+
+    before = _commit_count(repo)
+    _apply({"op": "update", "file": "big.bin", "body_path": str(staging / "big.bin"), "status": "in_progress"}, repo)
+    assert _commit_count(repo) == before
+
+    outside = tmp_path / "secret.txt"
+    outside.write_text("nope")
+    with pytest.raises(ValueError):
+        _apply({"op": "create", "file": "leak.txt", "body_path": str(outside), "status": "completed"}, repo)
+
+
+def test_ignored_paths_are_not_committed(tmp_path: Path):
+    """
+    A create or untracked rename onto a .gitignore'd path is refused (as
+    `git add` would), leaving nothing written or committed.
+    """
+    repo = _init_repo(tmp_path)
+    (repo / ".gitignore").write_text("build/\n")
+    _git(repo, "add", ".gitignore")
+    _git(repo, "commit", "-q", "-m", "ignore build")
+    before = _commit_count(repo)
+
+    with pytest.raises(PermissionError):
+        _apply({"op": "create", "file": "build/out.txt", "body": "x", "status": "in_progress"}, repo)
+    assert not (repo / "build/out.txt").exists()
+
+    (repo / "build").mkdir()
+    (repo / "build/a.txt").write_text("ignored\n")
+    with pytest.raises(PermissionError):
+        _apply(
+            {"op": "rename", "file": "build/a.txt", "target": "build/b.txt", "status": "completed"},
+            repo,
+        )
+    assert (repo / "build/a.txt").exists()
+    assert _commit_count(repo) == before
+
+
+@pytest.mark.parametrize("sendfile", ["off", "refused"])
+def test_staged_body_path_copy_fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sendfile: str):
+    """
+    The body_path copy works without sendfile(2) – non‑Linux platforms, or a
+    kernel that refuses it – via the read/write loop.
+    """
+    import apply_patch as ap
+
+    if sendfile == "off":
+        monkeypatch.setattr(ap, "_USE_SENDFILE", False)
+    else:
+        def _refuse(*_a, **_k):
+            raise OSError(22, "sendfile refused")
+
+        monkeypatch.setattr(ap, "_USE_SENDFILE", True)
+        monkeypatch.setattr(ap.os, "sendfile", _refuse, raising=False)
+
+    repo = _init_repo(tmp_path)
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    monkeypatch.setenv("GPT_REVIEW_STAGING_DIR", str(staging))
+    blob = os.urandom(ap._WRITE_BUFFER * 2 + 17)  # several buffers + a short tail
+    (staging / "big.bin").write_bytes(blob)
+
+    _apply({"op": "create", "file": "big.bin", "body_path": str(staging / "big.bin"), "status": "completed"}, repo)
+    assert (repo / "big.bin").read_bytes() == blob
+
+
+def test_pygit2_status_matches_git_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    The in‑process libgit2 answers (`_path_state`, `_is_ignored`) agree with
+    the git CLI fallbacks for clean, dirty, untracked, ignored and missing paths.
+    """
+    pytest.importorskip("pygit2")
+    import apply_patch as ap
+
+    repo = _init_repo(tmp_path, initial_file=True)
+    (repo / ".gitignore").write_text("build/\n")
+    (repo / "dirty.txt").write_text("v1\n")
+    _git(repo, "add", ".gitignore", "dirty.txt")
+    _git(repo, "commit", "-q", "-m", "fixtures")
+    (repo / "dirty.txt").write_text("v2\n")
+    (repo / "untracked.txt").write_text("new\n")
+    (repo / "build").mkdir()
+    (repo / "build/out.txt").write_text("ignored\n")
+
+    paths = ["baseline.txt", "dirty.txt", "untracked.txt", "build/out.txt", "missing.txt"]
+    with_pygit2 = {p: (ap._path_state(str(repo), p), ap._is_ignored(str(repo), p)) for p in paths}
+    for p in ("baseline.txt", "dirty.txt", "untracked.txt", "build/out.txt"):
+        assert ap._path_state_pygit2(str(repo), p) is not None, p  # libgit2 answered itself
+
+    monkeypatch.setattr(ap, "_pygit2", None)
+    with_cli = {p: (ap._path_state(str(repo), p), ap._is_ignored(str(repo), p)) for p in paths}
+
+    assert with_pygit2 == with_cli
+    assert with_cli == {
+        "baseline.txt": ((True, False), False),
+        "dirty.txt": ((True, True), False),
+        "untracked.txt": ((False, True), False),
+        "build/out.txt": ((False, False), True),
+        "missing.txt": ((False, False), False),
+    }
+
+
+def test_update_keeps_executable_bit(tmp_path: Path):
+    """
+    The atomic temp‑file write must not reset an existing file's mode.
+    """
+    repo = _init_repo(tmp_path)
+    _apply({"op": "create", "file": "run.sh", "body": "echo hi", "status": "in_progress"}, repo)
+    _apply({"op": "chmod", "file": "run.sh", "mode": "755", "status": "in_progress"}, repo)
+    _apply({"op": "update", "file": "run.sh", "body": "echo bye", "status": "completed"}, repo)
+
+    assert (repo / "run.sh").stat().st_mode & 0o777 == 0o755
+    assert (repo / "run.sh").read_text() == "echo bye\n"
+    assert not list(repo.glob(".run.sh.*"))
+
+
+def test_failed_replace_leaves_no_temp_file(tmp_path: Path):
+    """
+    If the final rename onto the target fails, the temp file is cleaned up.
+    """
+    import apply_patch as ap
+
+    target = tmp_path / "dest"
+    target.mkdir()
+    (target / "keep").write_text("x")  # a non‑empty dir: os.replace must fail
+    with pytest.raises(OSError):
+        ap._atomic_write_bytes(str(target), b"data")
+    assert not list(tmp_path.glob(".dest.*"))
+
+
+def test_apply_patches_batch(tmp_path: Path):
+    """
+    A batch is applied in order with one commit per patch.
+    """
+    repo = _init_repo(tmp_path)
+    batch = [
+        {"op": "create", "file": "a.txt", "body": "a", "status": "in_progress"},
+        json.dumps({"op": "update", "file": "a.txt", "body": "b", "status": "in_progress"}),
+        {"op": "rename", "file": "a.txt", "target": "b.txt", "status": "completed"},
+    ]
+    assert apply_patches(batch, str(repo)) == 3
+    assert (repo / "b.txt").read_text() == "b\n"
+    assert _commit_count(repo) == 3
+
+
 def test_refuse_local_overwrite(tmp_path: Path):
     """
     Local modification protection: update should fail when file is dirty.
@@ -224,6 +400,37 @@ def test_refuse_local_overwrite(tmp_path: Path):
     log.info("Local overwrite protection test passed.")
 
 
+def test_refuse_local_overwrite_between_patches(tmp_path: Path):
+    """
+    Edits made *between* two patches in one process must still be detected,
+    even when the index holds fresh stat data for the edited file: each
+    patch asks `_path_state` about its own path, nothing is carried over.
+    """
+    repo = _init_repo(tmp_path, initial_file=True)
+    (repo / "other.txt").write_text("other\n")
+    _git(repo, "add", "other.txt")
+    _git(repo, "commit", "-m", "other")
+
+    # Age the work tree so the index entries are not racy‑clean: the
+    # per‑path status probe must compare stat data, not just re‑hash.
+    old = time.time() - 3600
+    for name in ("baseline.txt", "other.txt"):
+        os.utime(repo / name, (old, old))
+    _git(repo, "update-index", "--really-refresh")
+
+    noop = {"op": "update", "file": "baseline.txt", "body": "baseline\n", "status": "in_progress"}
+    _apply(noop, repo)
+    _apply(noop, repo)
+
+    # user edits other.txt afterwards
+    (repo / "other.txt").write_text("local edit\n")
+
+    with pytest.raises(RuntimeError):
+        _apply({"op": "update", "file": "other.txt", "body": "gpt\n", "status": "in_progress"}, repo)
+
+    log.info("Per‑path status probe catches local edits made between patches.")
+
+
 def test_unsafe_chmod_rejected(tmp_path: Path):
     """
     chmod with mode 777 must raise PermissionError.
@@ -281,6 +488,20 @@ def test_path_traversal_blocked(tmp_path: Path):
     log.info("Path traversal protection test passed.")
 
 
+def test_symlinked_dir_escape_blocked(tmp_path: Path):
+    """
+    A directory symlink pointing outside the repo must not be written through.
+    """
+    repo = _init_repo(tmp_path)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (repo / "link").symlink_to(outside, target_is_directory=True)
+
+    with pytest.raises(ValueError):
+        _apply({"op": "create", "file": "link/escape.txt", "body": "hack", "status": "in_progress"}, repo)
+    assert not (outside / "escape.txt").exists()
+
+
 # =============================================================================
 # New high‑impact safety tests: **block any writes inside .git/**
 # =============================================================================
@@ -346,6 +567,18 @@ def test_reject_rename_target_into_dot_git(tmp_path: Path):
     log.info("Rename target into .git/ correctly rejected.")
 
 
+def test_dot_prefixed_names_are_not_mistaken_for_dot_git():
+    """
+    Only a literal leading './' is dropped: '.github/…' must keep its dot and
+    must not be treated as (or rewritten into) a `.git` path.
+    """
+    from apply_patch import _is_under_dot_git, _normalize_rel_input
+
+    assert _normalize_rel_input("././.github/ci.yml", field_name="file") == ".github/ci.yml"
+    assert not _is_under_dot_git(".github/ci.yml")
+    assert _is_under_dot_git("./.git/config")
+
+
 # =============================================================================
 # New high‑impact correctness test: **path‑scoped staging**
 # =============================================================================
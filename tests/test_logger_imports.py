@@ -11,10 +11,15 @@ Goals
   and the **shim** accessor (`from logger import get_logger`) must return the
   *same* underlying logger object for a given name (singleton semantics).
 * Repeated calls must **not** duplicate handlers (idempotent configuration).
+* Importing the package must **not** configure logging; handlers are attached
+  by the first `get_logger()` call.
 """
 from __future__ import annotations
 
 import logging
+import os
+import subprocess
+import sys
 
 from gpt_review.logger import get_logger as pkg_get_logger
 from logger import get_logger as shim_get_logger  # legacy shim
@@ -50,3 +55,65 @@ def test_idempotent_handlers() -> None:
 
     after = len(logger.handlers)
     assert after == before >= 1  # at least one handler, no duplicates added
+
+
+def test_package_import_defers_logger_setup() -> None:
+    """
+    `import gpt_review` alone must not import the packaged logger or attach
+    handlers (keeps `--version` and library imports free of log file I/O).
+    """
+    code = (
+        "import logging, sys\n"
+        "import gpt_review\n"
+        "assert 'gpt_review.logger' not in sys.modules\n"
+        "assert not logging.getLogger('gpt_review').handlers\n"
+        "gpt_review.get_logger('gpt_review.probe')\n"
+        "assert logging.getLogger('gpt_review').handlers\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_banner_written_once(tmp_path) -> None:
+    """
+    The startup banner is logged once, ahead of the first real record, and
+    every handler filter sees that first record.
+    """
+    code = (
+        "import logging, os\n"
+        "from gpt_review.logger import get_logger\n"
+        "log = get_logger('gpt_review.banner')\n"
+        "seen = []\n"
+        "for h in logging.getLogger('gpt_review').handlers:\n"
+        "    h.addFilter(lambda r: seen.append(r.getMessage()) or True)\n"
+        "log.info('first record')\n"
+        "get_logger('gpt_review.banner.again').info('second record')\n"
+        "assert 'first record' in seen, seen\n"
+        "path = os.path.join(os.environ['GPT_REVIEW_LOG_DIR'], 'gpt_review.log')\n"
+        "text = open(path, encoding='utf-8').read()\n"
+        "assert text.count('Logger initialised') == 1, text\n"
+        "assert text.index('Logger initialised') < text.index('first record')\n"
+    )
+    env = {**os.environ, "GPT_REVIEW_LOG_DIR": str(tmp_path)}
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_unwritable_log_dir_falls_back_to_temp(tmp_path) -> None:
+    """
+    A log dir that cannot be created falls back to $TMPDIR/gpt-review-logs,
+    without any '--- Logging error ---' report on stderr.
+    """
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x")
+    tmp = tmp_path / "tmp"
+    tmp.mkdir()
+    code = (
+        "from gpt_review.logger import get_logger\n"
+        "get_logger('gpt_review.fallback').info('hello fallback')\n"
+    )
+    env = {**os.environ, "GPT_REVIEW_LOG_DIR": str(blocker / "logs"), "TMPDIR": str(tmp)}
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert proc.returncode == 0, proc.stderr
+    assert "Logging error" not in proc.stderr
+    assert "hello fallback" in (tmp / "gpt-review-logs" / "gpt_review.log").read_text(encoding="utf-8")